@@ -4,7 +4,6 @@
 Wraps the NREL-PySAM lcoefcr and singleowner modules with
 additional reV features.
 """
-from copy import deepcopy
 import logging
 import numpy as np
 from warnings import warn
@@ -574,11 +573,10 @@ class SingleOwner(Economic):
         profiles = cls._get_cf_profiles(points_control.sites, cf_file, year)
 
         for i, site in enumerate(points_control.sites):
-            # get SAM inputs from project_points based on the current site
-            _, inputs = points_control.project_points[site]
-
-            # ensure that site-specific data is not persisted to other sites
-            site_inputs = deepcopy(inputs)
+            # get SAM inputs from project_points based on the current site.
+            # ProjectPoints returns a new copy of the inputs for every site so
+            # site-specific data is not persisted to other sites
+            _, site_inputs = points_control.project_points[site]
 
             # set the generation profile as an input.
             site_inputs = cls._make_gen_profile(i, site, profiles, site_df,
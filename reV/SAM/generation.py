@@ -5,7 +5,6 @@ Wraps the NREL-PySAM pvwattsv5, windpower, and tcsmolensalt modules with
 additional reV features.
 """
 from abc import ABC
-import copy
 import os
 import logging
 import numpy as np
@@ -53,7 +52,7 @@ class Generation(RevPySam, ABC):
             Output request list with the resource request entries removed.
         """
 
-        out_req_cleaned = copy.deepcopy(output_request)
+        out_req_cleaned = list(output_request)
         res_out = None
 
         res_reqs = []
@@ -89,7 +88,7 @@ class Generation(RevPySam, ABC):
             Output request list with the resource mean entries removed.
         """
 
-        out_req_nomeans = copy.deepcopy(output_request)
+        out_req_nomeans = list(output_request)
         res_mean = None
         idx = resource.sites.index(site)
 
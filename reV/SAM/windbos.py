@@ -2,7 +2,6 @@
 """
 SAM Wind Balance of System Cost Model
 """
-from copy import deepcopy
 import numpy as np
 from PySAM.PySSC import ssc_sim_from_dict
 
@@ -206,11 +205,10 @@ class WindBos:
         out = {}
 
         for site in points_control.sites:
-            # get SAM inputs from project_points based on the current site
-            _, inputs = points_control.project_points[site]
-
-            # ensure that site-specific data is not persisted to other sites
-            site_inputs = deepcopy(inputs)
+            # get SAM inputs from project_points based on the current site.
+            # ProjectPoints returns a new copy of the inputs for every site so
+            # site-specific data is not persisted to other sites
+            _, site_inputs = points_control.project_points[site]
 
             site_inputs.update(dict(site_df.loc[site, :]))
 
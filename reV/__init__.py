@@ -3,17 +3,9 @@
 The Renewable Energy Potential Model
 """
 from __future__ import print_function, division, absolute_import
+import importlib
 import os
 
-from reV.econ import Econ
-from reV.generation import Gen
-from reV.handlers import Outputs, ExclusionLayers
-from reV.pipeline import Pipeline, Status
-from reV.qa_qc import QaQc
-from reV.rep_profiles import RepProfiles
-from reV.supply_curve import (Aggregation, ExclusionMask,
-                              ExclusionMaskFromDict, SupplyCurveAggregation,
-                              SupplyCurve, TechMapping)
 from reV.version import __version__
 
 __author__ = """Galen Maclaurin"""
@@ -22,3 +14,38 @@ __email__ = "galen.maclaruin@nrel.gov"
 
 REVDIR = os.path.dirname(os.path.realpath(__file__))
 TESTDATADIR = os.path.join(os.path.dirname(REVDIR), 'tests', 'data')
+
+# Top level analysis classes and the reV sub-package they live in. These are
+# only imported on first access so that light entry points (e.g. the reV CLI)
+# do not import every reV module on startup.
+_LAZY_IMPORTS = {'Econ': 'reV.econ',
+                 'Gen': 'reV.generation',
+                 'Outputs': 'reV.handlers',
+                 'ExclusionLayers': 'reV.handlers',
+                 'Pipeline': 'reV.pipeline',
+                 'Status': 'reV.pipeline',
+                 'QaQc': 'reV.qa_qc',
+                 'RepProfiles': 'reV.rep_profiles',
+                 'Aggregation': 'reV.supply_curve',
+                 'ExclusionMask': 'reV.supply_curve',
+                 'ExclusionMaskFromDict': 'reV.supply_curve',
+                 'SupplyCurveAggregation': 'reV.supply_curve',
+                 'SupplyCurve': 'reV.supply_curve',
+                 'TechMapping': 'reV.supply_curve',
+                 }
+
+
+def __getattr__(name):
+    """Import the top level analysis classes on first access."""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name])
+        attr = getattr(module, name)
+        globals()[name] = attr
+        return attr
+
+    raise AttributeError('module {!r} has no attribute {!r}'
+                         .format(__name__, name))
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
@@ -19,11 +19,12 @@ import logging
 from warnings import warn
 
 from reV.pipeline.pipeline import Pipeline
+from reV.config.base_config import BaseConfig
 from reV.config.batch import BatchConfig
 from reV.utilities.exceptions import PipelineError
 from reV.pipeline.cli_pipeline import pipeline_monitor_background
 
-from rex.utilities import safe_json_load, parse_year
+from rex.utilities import parse_year
 from rex.utilities.loggers import init_logger
 
 
@@ -375,7 +376,9 @@ class BatchJob:
             implement in the json
         """
 
-        data = safe_json_load(fpath)
+        # the same source json is modified once per batch job, use the
+        # cached config loader (_mod_dict does not mutate the cached data)
+        data = BaseConfig.get_file(fpath)
         data = BatchJob._mod_dict(data, arg_mods)
 
         with open(fpath_out, 'w') as f:
@@ -9,6 +9,7 @@ from rex.utilities.utilities import get_class_properties
 
 from reV.batch.batch import BatchJob
 from reV.config.batch import BatchConfig
+from reV.utilities.cli_dtypes import EXISTINGFILE
 
 
 @click.group()
@@ -34,7 +35,7 @@ def valid_config_keys():
 
 @main.command()
 @click.option('--config_file', '-c', required=True,
-              type=click.Path(exists=True),
+              type=EXISTINGFILE,
               help='reV batch configuration json or csv file.')
 @click.option('--dry-run', is_flag=True,
               help='Flag to do a dry run (make batch dirs without running).')
@@ -54,7 +55,7 @@ def valid_config_keys():
 def from_config(ctx, config_file, dry_run, cancel, delete, monitor_background,
                 verbose):
     """Run reV batch from a config file."""
-    verbose = any([verbose, ctx.obj['VERBOSE']])
+    verbose = verbose or ctx.obj['VERBOSE']
 
     if cancel:
         BatchJob.cancel_all(config_file, verbose=verbose)
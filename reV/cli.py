@@ -5,31 +5,7 @@ reV command line interface (CLI).
 import click
 import logging
 
-from reV.batch.cli_batch import from_config as run_batch_from_config
-from reV.batch.cli_batch import valid_config_keys as batch_keys
-from reV.handlers.cli_collect import from_config as run_collect_from_config
-from reV.handlers.cli_collect import valid_config_keys as collect_keys
-from reV.handlers.cli_multi_year import from_config as run_my_from_config
-from reV.handlers.cli_multi_year import valid_config_keys as my_keys
-from reV.econ.cli_econ import from_config as run_econ_from_config
-from reV.econ.cli_econ import valid_config_keys as econ_keys
-from reV.generation.cli_gen import from_config as run_gen_from_config
-from reV.generation.cli_gen import valid_config_keys as gen_keys
-from reV.offshore.cli_offshore import from_config as run_offshore_from_config
-from reV.offshore.cli_offshore import valid_config_keys as offshore_keys
-from reV.pipeline.cli_pipeline import from_config as run_pipeline_from_config
-from reV.pipeline.cli_pipeline import valid_config_keys as pipeline_keys
-from reV.rep_profiles.cli_rep_profiles import from_config as run_rp_from_config
-from reV.rep_profiles.cli_rep_profiles import (valid_config_keys
-                                               as rep_profiles_keys)
-from reV.supply_curve.cli_sc_aggregation import (from_config
-                                                 as run_sc_agg_from_config)
-from reV.supply_curve.cli_sc_aggregation import (valid_config_keys
-                                                 as sc_agg_keys)
-from reV.supply_curve.cli_supply_curve import from_config as run_sc_from_config
-from reV.supply_curve.cli_supply_curve import valid_config_keys as sc_keys
-from reV.qa_qc.cli_qa_qc import from_config as run_qa_qc_from_config
-from reV.qa_qc.cli_qa_qc import valid_config_keys as qa_qc_keys
+from reV.utilities.cli_dtypes import EXISTINGFILE
 
 from rex.utilities.cli_dtypes import STR
 
@@ -40,7 +16,7 @@ logger = logging.getLogger(__name__)
 @click.option('--name', '-n', default='reV', type=STR,
               help='Job name. Default is "reV".')
 @click.option('--config_file', '-c',
-              required=True, type=click.Path(exists=True),
+              required=True, type=EXISTINGFILE,
               help='reV configuration file json for a single module.')
 @click.option('-v', '--verbose', is_flag=True,
               help='Flag to turn on debug logging. Default is not verbose.')
@@ -61,9 +37,10 @@ def generation(ctx, verbose):
     """Generation analysis (pv, csp, windpower, etc...)."""
     if ctx.invoked_subcommand is None:
         config_file = ctx.obj['CONFIG_FILE']
-        verbose = any([verbose, ctx.obj['VERBOSE']])
-        ctx.invoke(run_gen_from_config, config_file=config_file,
-                   verbose=verbose)
+        verbose = verbose or ctx.obj['VERBOSE']
+        from reV.generation.cli_gen import from_config as run_gen_from_config
+        run_gen_from_config.callback(config_file=config_file,
+                                     verbose=verbose)
 
 
 @generation.command()
@@ -72,6 +49,7 @@ def valid_generation_keys(ctx):
     """
     Valid Generation config keys
     """
+    from reV.generation.cli_gen import valid_config_keys as gen_keys
     ctx.invoke(gen_keys)
 
 
@@ -83,9 +61,10 @@ def econ(ctx, verbose):
     """Econ analysis (lcoe, single-owner, etc...)."""
     if ctx.invoked_subcommand is None:
         config_file = ctx.obj['CONFIG_FILE']
-        verbose = any([verbose, ctx.obj['VERBOSE']])
-        ctx.invoke(run_econ_from_config, config_file=config_file,
-                   verbose=verbose)
+        verbose = verbose or ctx.obj['VERBOSE']
+        from reV.econ.cli_econ import from_config as run_econ_from_config
+        run_econ_from_config.callback(config_file=config_file,
+                                      verbose=verbose)
 
 
 @econ.command()
@@ -94,6 +73,7 @@ def valid_econ_keys(ctx):
     """
     Valid Econ config keys
     """
+    from reV.econ.cli_econ import valid_config_keys as econ_keys
     ctx.invoke(econ_keys)
 
 
@@ -105,9 +85,11 @@ def offshore(ctx, verbose):
     """Offshore gen/econ aggregation with ORCA."""
     if ctx.invoked_subcommand is None:
         config_file = ctx.obj['CONFIG_FILE']
-        verbose = any([verbose, ctx.obj['VERBOSE']])
-        ctx.invoke(run_offshore_from_config, config_file=config_file,
-                   verbose=verbose)
+        verbose = verbose or ctx.obj['VERBOSE']
+        from reV.offshore.cli_offshore import (from_config
+                                               as run_offshore_from_config)
+        run_offshore_from_config.callback(config_file=config_file,
+                                          verbose=verbose)
 
 
 @offshore.command()
@@ -116,6 +98,7 @@ def valid_offshore_keys(ctx):
     """
     Valid offshore config keys
     """
+    from reV.offshore.cli_offshore import valid_config_keys as offshore_keys
     ctx.invoke(offshore_keys)
 
 
@@ -127,9 +110,11 @@ def collect(ctx, verbose):
     """Collect files from a job run on multiple nodes."""
     if ctx.invoked_subcommand is None:
         config_file = ctx.obj['CONFIG_FILE']
-        verbose = any([verbose, ctx.obj['VERBOSE']])
-        ctx.invoke(run_collect_from_config, config_file=config_file,
-                   verbose=verbose)
+        verbose = verbose or ctx.obj['VERBOSE']
+        from reV.handlers.cli_collect import (from_config
+                                              as run_collect_from_config)
+        run_collect_from_config.callback(config_file=config_file,
+                                         verbose=verbose)
 
 
 @collect.command()
@@ -138,6 +123,7 @@ def valid_collect_keys(ctx):
     """
     Valid Collect config keys
     """
+    from reV.handlers.cli_collect import valid_config_keys as collect_keys
     ctx.invoke(collect_keys)
 
 
@@ -159,10 +145,13 @@ def pipeline(ctx, cancel, monitor, background, verbose):
     """Execute multiple steps in a reV analysis pipeline."""
     if ctx.invoked_subcommand is None:
         config_file = ctx.obj['CONFIG_FILE']
-        verbose = any([verbose, ctx.obj['VERBOSE']])
-        ctx.invoke(run_pipeline_from_config, config_file=config_file,
-                   cancel=cancel, monitor=monitor, background=background,
-                   verbose=verbose)
+        verbose = verbose or ctx.obj['VERBOSE']
+        from reV.pipeline.cli_pipeline import (from_config
+                                               as run_pipeline_from_config)
+        run_pipeline_from_config.callback(config_file=config_file,
+                                          cancel=cancel, monitor=monitor,
+                                          background=background,
+                                          verbose=verbose)
 
 
 @pipeline.command()
@@ -171,6 +160,7 @@ def valid_pipeline_keys(ctx):
     """
     Valid Pipeline config keys
     """
+    from reV.pipeline.cli_pipeline import valid_config_keys as pipeline_keys
     ctx.invoke(pipeline_keys)
 
 
@@ -194,11 +184,13 @@ def batch(ctx, dry_run, cancel, delete, monitor_background, verbose):
     """Execute multiple steps in a reV analysis pipeline."""
     if ctx.invoked_subcommand is None:
         config_file = ctx.obj['CONFIG_FILE']
-        verbose = any([verbose, ctx.obj['VERBOSE']])
-        ctx.invoke(run_batch_from_config, config_file=config_file,
-                   dry_run=dry_run, cancel=cancel, delete=delete,
-                   monitor_background=monitor_background,
-                   verbose=verbose)
+        verbose = verbose or ctx.obj['VERBOSE']
+        from reV.batch.cli_batch import from_config as run_batch_from_config
+        run_batch_from_config.callback(config_file=config_file,
+                                       dry_run=dry_run, cancel=cancel,
+                                       delete=delete,
+                                       monitor_background=monitor_background,
+                                       verbose=verbose)
 
 
 @batch.command()
@@ -207,6 +199,7 @@ def valid_batch_keys(ctx):
     """
     Valid Batch config keys
     """
+    from reV.batch.cli_batch import valid_config_keys as batch_keys
     ctx.invoke(batch_keys)
 
 
@@ -218,9 +211,11 @@ def multi_year(ctx, verbose):
     """Run reV multi year using the config file."""
     if ctx.invoked_subcommand is None:
         config_file = ctx.obj['CONFIG_FILE']
-        verbose = any([verbose, ctx.obj['VERBOSE']])
-        ctx.invoke(run_my_from_config, config_file=config_file,
-                   verbose=verbose)
+        verbose = verbose or ctx.obj['VERBOSE']
+        from reV.handlers.cli_multi_year import (from_config
+                                                 as run_my_from_config)
+        run_my_from_config.callback(config_file=config_file,
+                                    verbose=verbose)
 
 
 @multi_year.command()
@@ -229,6 +224,7 @@ def valid_multi_year_keys(ctx):
     """
     Valid Multi Year config keys
     """
+    from reV.handlers.cli_multi_year import valid_config_keys as my_keys
     ctx.invoke(my_keys)
 
 
@@ -240,9 +236,11 @@ def supply_curve_aggregation(ctx, verbose):
     """Run reV supply curve aggregation using the config file."""
     if ctx.invoked_subcommand is None:
         config_file = ctx.obj['CONFIG_FILE']
-        verbose = any([verbose, ctx.obj['VERBOSE']])
-        ctx.invoke(run_sc_agg_from_config, config_file=config_file,
-                   verbose=verbose)
+        verbose = verbose or ctx.obj['VERBOSE']
+        from reV.supply_curve.cli_sc_aggregation import (
+            from_config as run_sc_agg_from_config)
+        run_sc_agg_from_config.callback(config_file=config_file,
+                                        verbose=verbose)
 
 
 @supply_curve_aggregation.command()
@@ -251,6 +249,8 @@ def valid_supply_curve_aggregation_keys(ctx):
     """
     Valid Supply Curve Aggregation config keys
     """
+    from reV.supply_curve.cli_sc_aggregation import (valid_config_keys
+                                                     as sc_agg_keys)
     ctx.invoke(sc_agg_keys)
 
 
@@ -262,9 +262,11 @@ def supply_curve(ctx, verbose):
     """Run reV supply curve using the config file."""
     if ctx.invoked_subcommand is None:
         config_file = ctx.obj['CONFIG_FILE']
-        verbose = any([verbose, ctx.obj['VERBOSE']])
-        ctx.invoke(run_sc_from_config, config_file=config_file,
-                   verbose=verbose)
+        verbose = verbose or ctx.obj['VERBOSE']
+        from reV.supply_curve.cli_supply_curve import (from_config
+                                                       as run_sc_from_config)
+        run_sc_from_config.callback(config_file=config_file,
+                                    verbose=verbose)
 
 
 @supply_curve.command()
@@ -273,6 +275,7 @@ def valid_supply_curve_keys(ctx):
     """
     Valid Supply Curve config keys
     """
+    from reV.supply_curve.cli_supply_curve import valid_config_keys as sc_keys
     ctx.invoke(sc_keys)
 
 
@@ -284,9 +287,11 @@ def rep_profiles(ctx, verbose):
     """Run reV representative profiles using the config file."""
     if ctx.invoked_subcommand is None:
         config_file = ctx.obj['CONFIG_FILE']
-        verbose = any([verbose, ctx.obj['VERBOSE']])
-        ctx.invoke(run_rp_from_config, config_file=config_file,
-                   verbose=verbose)
+        verbose = verbose or ctx.obj['VERBOSE']
+        from reV.rep_profiles.cli_rep_profiles import (from_config
+                                                       as run_rp_from_config)
+        run_rp_from_config.callback(config_file=config_file,
+                                    verbose=verbose)
 
 
 @rep_profiles.command()
@@ -295,6 +300,8 @@ def valid_rep_profiles_keys(ctx):
     """
     Valid Representative Profiles config keys
     """
+    from reV.rep_profiles.cli_rep_profiles import (valid_config_keys
+                                                   as rep_profiles_keys)
     ctx.invoke(rep_profiles_keys)
 
 
@@ -306,9 +313,10 @@ def qa_qc(ctx, verbose):
     """Run reV QA/QC using the config file."""
     if ctx.invoked_subcommand is None:
         config_file = ctx.obj['CONFIG_FILE']
-        verbose = any([verbose, ctx.obj['VERBOSE']])
-        ctx.invoke(run_qa_qc_from_config, config_file=config_file,
-                   verbose=verbose)
+        verbose = verbose or ctx.obj['VERBOSE']
+        from reV.qa_qc.cli_qa_qc import from_config as run_qa_qc_from_config
+        run_qa_qc_from_config.callback(config_file=config_file,
+                                       verbose=verbose)
 
 
 @qa_qc.command()
@@ -317,6 +325,7 @@ def valid_qa_qc_keys(ctx):
     """
     Valid QA/QC config keys
     """
+    from reV.qa_qc.cli_qa_qc import valid_config_keys as qa_qc_keys
     ctx.invoke(qa_qc_keys)
 
 
@@ -19,6 +19,12 @@ class AnalysisConfig(BaseConfig):
 
     NAME = None
 
+    # static map of avail execution options with corresponding classes
+    EXECUTION_CONFIGS = {'local': BaseExecutionConfig,
+                         'slurm': SlurmConfig,
+                         'eagle': SlurmConfig,
+                         }
+
     def __init__(self, config, run_preflight=True, check_keys=True):
         """
         Parameters
@@ -57,6 +63,36 @@ class AnalysisConfig(BaseConfig):
             logger.error(e)
             raise ConfigError(e)
 
+        option = self['execution_control'].get('option')
+        self._check_execution_option(option)
+
+    def _check_execution_option(self, option):
+        """Check that an execution control option is recognized.
+
+        Parameters
+        ----------
+        option : str | None
+            Execution control option from the "execution_control" block.
+            None (missing or null) defaults to "local".
+
+        Returns
+        -------
+        option : str
+            Lower-case execution control option.
+        """
+        if option is None:
+            option = 'local'
+
+        option = str(option).lower()
+        if option not in self.EXECUTION_CONFIGS:
+            e = ('Execution control option not recognized: "{}". '
+                 'Available options are: {}.'
+                 .format(option, list(self.EXECUTION_CONFIGS.keys())))
+            logger.error(e)
+            raise ConfigError(e)
+
+        return option
+
     @property
     def years(self):
         """Get the analysis years.
@@ -122,22 +158,10 @@ class AnalysisConfig(BaseConfig):
         """
         if self._ec is None:
             ec = self['execution_control']
-            # static map of avail execution options with corresponding classes
-            ec_config_types = {'local': BaseExecutionConfig,
-                               'slurm': SlurmConfig,
-                               'eagle': SlurmConfig,
-                               }
             if 'option' in ec:
-                try:
-                    # Try setting the attribute to the appropriate exec option
-                    self._ec = ec_config_types[ec['option'].lower()](ec)
-                except KeyError:
-                    # Option not found
-                    raise ConfigError('Execution control option not '
-                                      'recognized: "{}". '
-                                      'Available options are: {}.'
-                                      .format(ec['option'].lower(),
-                                              list(ec_config_types.keys())))
+                # set the attribute to the appropriate exec option
+                option = self._check_execution_option(ec['option'])
+                self._ec = self.EXECUTION_CONFIGS[option](ec)
             else:
                 # option not specified, default to a base execution (local)
                 warn('Execution control option not specified. '
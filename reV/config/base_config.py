@@ -2,20 +2,182 @@
 """
 reV Base Configuration Framework
 """
+from functools import lru_cache
 import json
 import logging
 import os
+import re
 
-from rex.utilities import safe_json_load
 from rex.utilities.utilities import get_class_properties
 
-from reV.utilities.exceptions import ConfigError
+from reV.utilities.exceptions import ConfigError, JSONError
 
 logger = logging.getLogger(__name__)
 REVDIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 TESTDATADIR = os.path.join(os.path.dirname(REVDIR), 'tests', 'data')
 
 
+@lru_cache(maxsize=32)
+def _load_json(fpath, mtime_ns, size):
+    """Load a json file, memoized on the file's path, mtime, and size.
+
+    The file modification time and size are part of the cache key so that
+    an edited file is always re-read.
+
+    Parameters
+    ----------
+    fpath : str
+        Full real path to a .json file.
+    mtime_ns : int
+        File modification time in nanoseconds.
+    size : int
+        File size in bytes.
+
+    Returns
+    -------
+    data : dict
+        Parsed json data. This object is shared between calls and must not be
+        mutated in place.
+    """
+    # read the whole file in one call and parse the buffer with the C json
+    # scanner instead of streaming through a text-mode file object
+    with open(fpath, 'rb') as f:
+        raw = f.read()
+
+    try:
+        data = json.loads(raw)
+    except json.decoder.JSONDecodeError as e:
+        msg = ('JSON Error:\n{}\nCannot read json file: "{}"'
+               .format(e, fpath))
+        logger.error(msg)
+        raise JSONError(msg)
+
+    return data
+
+
+@lru_cache(maxsize=32)
+def _str_rep_pattern(keys):
+    """Compile a regex that matches any of the string replacement keys.
+
+    Parameters
+    ----------
+    keys : tuple
+        Strings to search for. Longer keys take precedence over shorter keys
+        that match at the same position.
+
+    Returns
+    -------
+    pattern : re.Pattern
+        Compiled alternation of all (escaped) keys.
+    """
+    keys = sorted(keys, key=len, reverse=True)
+    return re.compile('|'.join(re.escape(k) for k in keys))
+
+
+def _str_rep_value(value, pattern, strrep):
+    """Replace all strrep keys in a single pass over a str value.
+
+    Parameters
+    ----------
+    value : obj
+        Config value. Only str values are modified.
+    pattern : re.Pattern | None
+        Compiled pattern from _str_rep_pattern(). None for no replacement.
+    strrep : dict
+        Replacement mapping of matched keys to new values.
+
+    Returns
+    -------
+    value : obj
+        Value with replaced strings.
+    """
+    if pattern is not None and isinstance(value, str):
+        value = pattern.sub(lambda m: strrep[m.group(0)], value)
+
+    return value
+
+
+def _new_container(value):
+    """Get an empty container to rebuild value into.
+
+    Parameters
+    ----------
+    value : obj
+        Config value.
+
+    Returns
+    -------
+    out : dict | list | None
+        Empty dict or list of the same length as value, None if value is
+        not a container.
+    """
+    if isinstance(value, dict):
+        return {}
+    elif isinstance(value, list):
+        return [None] * len(value)
+    else:
+        return None
+
+
+def _str_rep_walk(d, out, pattern, strrep):
+    """Rebuild the nested dicts and lists of d into out with replaced strings.
+
+    The walk uses an explicit stack of (source, rebuilt) container pairs
+    instead of recursing. A memo maps id(source) to its rebuilt container so
+    that sub-containers referenced from multiple places are only processed
+    once and stay shared in the output.
+
+    Parameters
+    ----------
+    d : dict | list
+        Source container. Not modified.
+    out : dict | list
+        Empty container from _new_container(d) to populate.
+    pattern : re.Pattern | None
+        Compiled pattern from _str_rep_pattern(). None for no replacement.
+    strrep : dict
+        Replacement mapping of matched keys to new values.
+    """
+    memo = {id(d): out}
+    stack = [(d, out)]
+    while stack:
+        source, rebuilt = stack.pop()
+        if isinstance(source, dict):
+            items = source.items()
+        else:
+            items = enumerate(source)
+
+        for key, val in items:
+            if id(val) in memo:
+                rebuilt[key] = memo[id(val)]
+                continue
+
+            new = _new_container(val)
+            if new is None:
+                rebuilt[key] = _str_rep_value(val, pattern, strrep)
+            else:
+                memo[id(val)] = new
+                rebuilt[key] = new
+                stack.append((val, new))
+
+
+@lru_cache(maxsize=None)
+def _class_properties(cls):
+    """Get the names of all properties of a class, memoized per class.
+
+    Parameters
+    ----------
+    cls : type
+        Config class to inspect.
+
+    Returns
+    -------
+    properties : tuple
+        Names of all class properties.
+    """
+    return tuple(get_class_properties(cls))
+
+
 class BaseConfig(dict):
     """Base class for configuration frameworks."""
     REQUIREMENTS = ()
@@ -142,7 +304,7 @@ class BaseConfig(dict):
             List of class properties, each of which should represent a valid
             config key/entry
         """
-        return get_class_properties(cls)
+        return list(_class_properties(cls))
 
     def _check_keys(self):
         """
@@ -201,9 +363,11 @@ class BaseConfig(dict):
                 # attempt to deserialize non-json string
                 config = json.loads(config)
 
-        # Perform string replacement, save config to self instance
-        if self._perform_str_rep:
-            config = self.str_replace(config, self.str_rep)
+        # Perform string replacement, save config to self instance. This
+        # always rebuilds the nested containers so that cached file data is
+        # never mutated.
+        strrep = self.str_rep if self._perform_str_rep else {}
+        config = self.str_replace(config, strrep)
 
         self.set_self_dict(config)
 
@@ -216,11 +380,40 @@ class BaseConfig(dict):
         flist : list
             List of files (with paths) to check existance of.
         """
+        # group files by directory so that directories with many files
+        # (e.g. one file per year) are listed once instead of stat'ing
+        # every file
+        dirs = {}
         for f in flist:
             # ignore files that are to be specified using pipeline utils
             if 'PIPELINE' not in os.path.basename(f):
-                if os.path.exists(f) is False:
-                    raise IOError('File does not exist: {}'.format(f))
+                dirs.setdefault(os.path.dirname(f), []).append(f)
+
+        for d, files in dirs.items():
+            present = None
+            if len(files) > 1:
+                try:
+                    with os.scandir(d or '.') as it:
+                        # broken symlinks are missing, same as os.path.exists
+                        present = {entry.name for entry in it
+                                   if not entry.is_symlink()
+                                   or os.path.exists(entry.path)}
+                except OSError:
+                    # directory can't be listed (e.g. missing or no read
+                    # permission), fall back to checking each file
+                    present = None
+
+            if present is None:
+                missing = [f for f in files if not os.path.exists(f)]
+            else:
+                # names not in the listing (e.g. "dir/.") get the same
+                # os.path.exists check as the single file path
+                missing = [f for f in files
+                           if os.path.basename(f) not in present
+                           and not os.path.exists(f)]
+
+            if missing:
+                raise IOError('File does not exist: {}'.format(missing[0]))
 
     @staticmethod
     def str_replace(d, strrep):
@@ -232,32 +425,26 @@ class BaseConfig(dict):
             Config dictionary potentially containing strings to replace.
         strrep : dict
             Replacement mapping where keys are strings to search for and values
-            are the new values.
+            are the new values. All keys are replaced in a single pass where
+            the longest key wins when several keys match at the same
+            position (e.g. "../" before "./"). Replaced text is not searched
+            again, so the output of one key is never matched by another key.
 
         Returns
         -------
         d : dict
-            Config dictionary with replaced strings.
+            New config dictionary with replaced strings. The input d is not
+            modified.
         """
 
-        if isinstance(d, dict):
-            # go through dict keys and values
-            for key, val in d.items():
-                d[key] = BaseConfig.str_replace(val, strrep)
-
-        elif isinstance(d, list):
-            # if the value is also a list, iterate through
-            for i, entry in enumerate(d):
-                d[i] = BaseConfig.str_replace(entry, strrep)
+        pattern = _str_rep_pattern(tuple(strrep)) if strrep else None
+        out = _new_container(d)
+        if out is None:
+            return _str_rep_value(d, pattern, strrep)
 
-        elif isinstance(d, str):
-            # if val is a str, check to see if str replacements apply
-            for old_str, new in strrep.items():
-                # old_str is in the value, replace with new value
-                d = d.replace(old_str, new)
+        _str_rep_walk(d, out, pattern, strrep)
 
-        # return updated
-        return d
+        return out
 
     def set_self_dict(self, dictlike):
         """Save a dict-like variable as object instance dictionary items.
@@ -267,8 +454,7 @@ class BaseConfig(dict):
         dictlike : dict
             Python namespace object to set to this dictionary-emulating class.
         """
-        for key, val in dictlike.items():
-            self.__setitem__(key, val)
+        self.update(dictlike)
 
     @staticmethod
     def get_file(fname):
@@ -282,16 +468,23 @@ class BaseConfig(dict):
         Returns
         -------
         config : dict
-            Config data.
+            Config data. Parsed files are cached for the life of the process
+            (until the file is modified) so this object must not be mutated in
+            place.
         """
 
         logger.debug('Getting "{}"'.format(fname))
-        if os.path.exists(fname) and fname.endswith('.json'):
-            config = safe_json_load(fname)
-        elif os.path.exists(fname) is False:
+        try:
+            stat = os.stat(fname)
+        except FileNotFoundError as e:
             raise FileNotFoundError('Configuration file does not exist: "{}"'
-                                    .format(fname))
-        else:
+                                    .format(fname)) from e
+
+        if not fname.endswith('.json'):
             raise ConfigError('Unknown error getting configuration file: "{}"'
                               .format(fname))
+
+        config = _load_json(os.path.realpath(fname), stat.st_mtime_ns,
+                            stat.st_size)
+
         return config
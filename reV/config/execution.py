@@ -12,6 +12,14 @@ logger = logging.getLogger(__name__)
 class BaseExecutionConfig(BaseConfig):
     """Base class to handle execution configuration"""
 
+    # values used for execution control keys that are missing or null
+    DEFAULTS = {'option': 'local',
+                'nodes': 1,
+                'max_workers': None,
+                'sites_per_worker': None,
+                'memory_utilization_limit': 0.4,
+                }
+
     def __init__(self, config_dict):
         """
         Parameters
@@ -22,11 +30,25 @@ class BaseExecutionConfig(BaseConfig):
         """
         super().__init__(config_dict)
 
-        self._option = 'local'
-        self._nodes = 1
-        self._max_workers = None
-        self._sites_per_worker = None
-        self._mem_util_lim = 0.4
+    def _get_value(self, key):
+        """Get an execution control value or its default if missing or null.
+
+        Parameters
+        ----------
+        key : str
+            Execution control key, must be in DEFAULTS.
+
+        Returns
+        -------
+        value : object
+            Config value for key, or DEFAULTS[key] if the key is not in the
+            config or is set to None.
+        """
+        value = self.get(key)
+        if value is None:
+            value = self.DEFAULTS[key]
+
+        return value
 
     @property
     def option(self):
@@ -37,8 +59,7 @@ class BaseExecutionConfig(BaseConfig):
         option : str
             Execution control option, e.g. local, peregrine, eagle...
         """
-        self._option = str(self.get('option', self._option)).lower()
-        return self._option
+        return str(self._get_value('option')).lower()
 
     @property
     def nodes(self):
@@ -49,8 +70,7 @@ class BaseExecutionConfig(BaseConfig):
         nodes : int
             Number of available nodes. Default is 1 node.
         """
-        self._nodes = int(self.get('nodes', self._nodes))
-        return self._nodes
+        return int(self._get_value('nodes'))
 
     @property
     def max_workers(self):
@@ -61,8 +81,7 @@ class BaseExecutionConfig(BaseConfig):
         max_workers : int | None
             Processes per node. Default is None max_workers (all available).
         """
-        self._max_workers = self.get('max_workers', self._max_workers)
-        return self._max_workers
+        return self._get_value('max_workers')
 
     @property
     def sites_per_worker(self):
@@ -73,9 +92,7 @@ class BaseExecutionConfig(BaseConfig):
         sites_per_worker : int | None
             Number of sites to run per worker in a parallel scheme.
         """
-        self._sites_per_worker = self.get('sites_per_worker',
-                                          self._sites_per_worker)
-        return self._sites_per_worker
+        return self._get_value('sites_per_worker')
 
     @property
     def memory_utilization_limit(self):
@@ -88,14 +105,19 @@ class BaseExecutionConfig(BaseConfig):
             Memory utilization limit (fractional). Key in the config json is
             "memory_utilization_limit".
         """
-        self._mem_util_lim = self.get('memory_utilization_limit',
-                                      self._mem_util_lim)
-        return self._mem_util_lim
+        return self._get_value('memory_utilization_limit')
 
 
 class HPCConfig(BaseExecutionConfig):
     """Class to handle HPC configuration inputs."""
 
+    DEFAULTS = dict(BaseExecutionConfig.DEFAULTS,
+                    allocation='rev',
+                    feature=None,
+                    module=None,
+                    conda_env=None,
+                    )
+
     def __init__(self, config_dict):
         """
         Parameters
@@ -107,11 +129,6 @@ class HPCConfig(BaseExecutionConfig):
 
         super().__init__(config_dict)
 
-        self._hpc_alloc = 'rev'
-        self._feature = None
-        self._module = None
-        self._conda_env = None
-
     @property
     def allocation(self):
         """Get the HPC allocation property.
@@ -121,8 +138,7 @@ class HPCConfig(BaseExecutionConfig):
         hpc_alloc : str
             Name of the HPC allocation account for the specified job.
         """
-        self._hpc_alloc = self.get('allocation', self._hpc_alloc)
-        return self._hpc_alloc
+        return self._get_value('allocation')
 
     @property
     def feature(self):
@@ -138,8 +154,7 @@ class HPCConfig(BaseExecutionConfig):
                 "feature": "--qos=high"
                 "feature": "--depend=[state:job_id]"
         """
-        self._feature = self.get('feature', self._feature)
-        return self._feature
+        return self._get_value('feature')
 
     @property
     def module(self):
@@ -151,8 +166,7 @@ class HPCConfig(BaseExecutionConfig):
         module : str
             Module to load on node
         """
-        self._module = self.get('module', self._module)
-        return self._module
+        return self._get_value('module')
 
     @property
     def conda_env(self):
@@ -164,13 +178,17 @@ class HPCConfig(BaseExecutionConfig):
         conda_env : str
             Conda environment to activate
         """
-        self._conda_env = self.get('conda_env', self._conda_env)
-        return self._conda_env
+        return self._get_value('conda_env')
 
 
 class SlurmConfig(HPCConfig):
     """Class to handle SLURM (Eagle) configuration inputs."""
 
+    DEFAULTS = dict(HPCConfig.DEFAULTS,
+                    memory=None,
+                    walltime=1,
+                    )
+
     def __init__(self, config_dict):
         """
         Parameters
@@ -182,9 +200,6 @@ class SlurmConfig(HPCConfig):
 
         super().__init__(config_dict)
 
-        self._hpc_node_mem = None
-        self._hpc_walltime = 1
-
     @property
     def memory(self):
         """Get the requested Eagle node "memory" value in GB or can be None.
@@ -194,8 +209,7 @@ class SlurmConfig(HPCConfig):
         _hpc_node_mem : int | None
             Requested node memory in GB.
         """
-        self._hpc_node_mem = self.get('memory', self._hpc_node_mem)
-        return self._hpc_node_mem
+        return self._get_value('memory')
 
     @property
     def walltime(self):
@@ -206,5 +220,4 @@ class SlurmConfig(HPCConfig):
         _hpc_walltime : int
             Requested single node job time in hours.
         """
-        self._hpc_walltime = float(self.get('walltime', self._hpc_walltime))
-        return self._hpc_walltime
+        return float(self._get_value('walltime'))
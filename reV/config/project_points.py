@@ -3,6 +3,7 @@
 reV Project Points Configuration
 """
 import copy
+from functools import lru_cache
 import logging
 from math import ceil
 import numpy as np
@@ -23,8 +24,40 @@ from rex.utilities import check_res_file, parse_table
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=16)
+def _res_n_sites(res_file, mtime):
+    """Get the number of sites in a resource file, memoized per file.
+
+    Parameters
+    ----------
+    res_file : str
+        Single resource .h5 file or multi-file resource path pattern.
+    mtime : float | None
+        Resource file modification time (None for multi-file resource).
+        Part of the cache key so that a modified file is re-read.
+
+    Returns
+    -------
+    n_sites : int
+        Length of the resource meta data.
+    """
+    multi_h5_res, _ = check_res_file(res_file)
+    if multi_h5_res:
+        with MultiFileResource(res_file) as res:
+            n_sites = res.shape[1]
+    else:
+        with Resource(res_file) as res:
+            n_sites = res.shape[1]
+
+    return n_sites
+
+
 class PointsControl:
     """Class to manage and split ProjectPoints."""
+
+    __slots__ = ['_project_points', '_sites_per_split', '_split_range', '_i',
+                 '_iter_list']
+
     def __init__(self, project_points, sites_per_split=100):
         """
         Parameters
@@ -44,22 +77,18 @@ class PointsControl:
 
     def __iter__(self):
         """Initialize the iterator by pre-splitting into a list attribute."""
-        last_site = 0
         ilim = len(self.project_points)
 
+        gids = self.project_points.df['gid'].values
         logger.debug('PointsControl iterator initializing with sites '
-                     '{} through {}'.format(self.project_points.sites[0],
-                                            self.project_points.sites[-1]))
-
-        # pre-initialize all iter objects
-        while True:
-            i0 = last_site
-            i1 = np.min([i0 + self.sites_per_split, ilim])
-            if i0 == i1:
-                break
+                     '{} through {}'.format(gids[0], gids[-1]))
 
-            last_site = i1
+        # pre-compute the (inclusive, exclusive) index range of every split
+        split_ranges = [(i0, min(i0 + self.sites_per_split, ilim))
+                        for i0 in range(0, ilim, self.sites_per_split)]
 
+        # pre-initialize all iter objects
+        for i0, i1 in split_ranges:
             new = PointsControl.split(i0, i1, self.project_points,
                                       sites_per_split=self.sites_per_split)
             new._split_range = [i0, i1]
@@ -67,7 +96,7 @@ class PointsControl:
 
         logger.debug('PointsControl stopped iteration at attempted '
                      'index of {}. Length of iterator is: {}'
-                     .format(i1, len(self)))
+                     .format(ilim, len(self)))
         return self
 
     def __next__(self):
@@ -94,8 +123,9 @@ class PointsControl:
         return next_pc
 
     def __repr__(self):
+        gids = self.project_points.df['gid'].values
         msg = ("{} for sites {} through {}"
-               .format(self.__class__.__name__, self.sites[0], self.sites[-1]))
+               .format(self.__class__.__name__, gids[0], gids[-1]))
         return msg
 
     def __len__(self):
@@ -211,6 +241,9 @@ class ProjectPoints:
     >>> h_list = pp.h
     """
 
+    __slots__ = ['_gid_config_map', '_gid_index_map', '_df', '_sam_config_obj',
+                 '_tech', '_h', '_curtailment']
+
     def __init__(self, points, sam_config, tech=None, res_file=None,
                  curtailment=None):
         """
@@ -243,6 +276,8 @@ class ProjectPoints:
         """
 
         # set protected attributes
+        self._gid_config_map = None
+        self._gid_index_map = None
         self._df = self._parse_points(points, res_file=res_file)
         self._sam_config_obj = self._parse_sam_config(sam_config)
         self._check_points_config_mapping()
@@ -268,24 +303,26 @@ class ProjectPoints:
             names (keys) and values.
         """
 
-        site_bool = (self.df['gid'] == site)
         try:
-            config_id = self.df.loc[site_bool, 'config'].values[0]
+            config_id = self.gid_config_map[site]
         except KeyError:
             raise KeyError('Site {} not found in this instance of '
                            'ProjectPoints. Available sites include: {}'
                            .format(site, self.sites))
 
-        return config_id, copy.deepcopy(self.sam_configs[config_id])
+        sam_config = self._sam_config_obj.inputs[config_id]
+
+        return config_id, copy.deepcopy(sam_config)
 
     def __repr__(self):
+        gids = self.df['gid'].values
         msg = ("{} for sites {} through {}"
-               .format(self.__class__.__name__, self.sites[0], self.sites[-1]))
+               .format(self.__class__.__name__, gids[0], gids[-1]))
         return msg
 
     def __len__(self):
         """Length of this object is the number of sites."""
-        return len(self.sites)
+        return len(self.df)
 
     @staticmethod
     def _parse_points(points, res_file=None):
@@ -321,8 +358,9 @@ class ProjectPoints:
             raise KeyError('Project points data must contain "gid" and '
                            '"config" column headers.')
 
+        # O(n) check for sorted gids instead of sorting a copy to compare
         gids = df['gid'].values
-        if not np.array_equal(np.sort(gids), gids):
+        if (np.diff(gids) < 0).any():
             msg = ('WARNING: points are not in sequential order and will be '
                    'sorted! The original order is being preserved under '
                    'column "points_order"')
@@ -374,10 +412,9 @@ class ProjectPoints:
         df : pd.DataFrame
             DataFrame mapping sites (gids) to SAM technology (config)
         """
-        df = pd.DataFrame(columns=['gid', 'config'])
         if isinstance(points, (list, tuple)):
             # explicit site list, set directly
-            df['gid'] = points
+            gids = points
         elif isinstance(points, slice):
             stop = points.stop
             if stop is None:
@@ -386,19 +423,22 @@ class ProjectPoints:
                                      'points is a slice of type '
                                      ' slice(*, None, *)')
 
-                multi_h5_res, _ = check_res_file(res_file)
-                if multi_h5_res:
-                    stop = MultiFileResource(res_file).shape[1]
-                else:
-                    stop = Resource(res_file).shape[1]
+                mtime = None
+                if os.path.isfile(res_file):
+                    mtime = os.path.getmtime(res_file)
+
+                stop = _res_n_sites(res_file, mtime)
 
-            df['gid'] = list(range(*points.indices(stop)))
+            gids = np.arange(*points.indices(stop))
         else:
             raise TypeError('Project Points sites needs to be set as a list, '
                             'tuple, or slice, but was set as: {}'
                             .format(type(points)))
 
-        df['config'] = None
+        # build the frame in one shot rather than assigning columns to an
+        # empty frame
+        df = pd.DataFrame({'gid': gids, 'config': None},
+                          columns=['gid', 'config'])
 
         return df
 
@@ -416,14 +456,21 @@ class ProjectPoints:
         ind : int
             Row index of gid in the project points dataframe.
         """
-        if gid not in self._df['gid'].values:
+        if self._gid_index_map is None:
+            # map each gid to its first row index, built once so that
+            # repeated lookups are O(1) instead of a scan of the gid column
+            self._gid_index_map = {}
+            for i, site in enumerate(self._df['gid'].values.tolist()):
+                self._gid_index_map.setdefault(site, i)
+
+        try:
+            ind = self._gid_index_map[gid]
+        except KeyError:
             e = ('Requested resource gid {} is not present in the project '
                  'points dataframe. Cannot return row index.'.format(gid))
             logger.error(e)
             raise ConfigError(e)
 
-        ind = np.where(self._df['gid'] == gid)[0][0]
-
         return ind
 
     @property
@@ -438,6 +485,27 @@ class ProjectPoints:
         """
         return self._df
 
+    @property
+    def gid_config_map(self):
+        """Get a mapping of site gids to SAM configuration IDs.
+
+        Returns
+        -------
+        _gid_config_map : dict
+            Dictionary with site gids as keys and SAM configuration IDs as
+            values. Built once from the project points dataframe so that
+            single site lookups are O(1). Duplicate gids map to the config
+            of their first occurrence, consistent with index().
+        """
+        if self._gid_config_map is None:
+            gids = self._df['gid'].values.tolist()
+            configs = self._df['config'].values.tolist()
+            self._gid_config_map = {}
+            for site, config in zip(gids, configs):
+                self._gid_config_map.setdefault(site, config)
+
+        return self._gid_config_map
+
     @staticmethod
     def _parse_sam_config(sam_config):
         """
@@ -527,12 +595,11 @@ class ProjectPoints:
             SAM technology configs. For example, "gcr" or "losses" for PVWatts
             or "wind_turbine_hub_ht" for windpower.
         """
-        keys = []
+        keys = set()
         for sam_config in self.sam_configs.values():
-            keys += list(sam_config.keys())
+            keys.update(sam_config)
 
-        keys = list(set(keys))
-        return keys
+        return list(keys)
 
     def _check_points_config_mapping(self):
         """
@@ -621,20 +688,26 @@ class ProjectPoints:
             The type is slice if possible. Will be a list only if sites are
             non-sequential.
         """
+        gids = self.df['gid'].values
         # try_slice is what the sites list would be if it is sequential
-        if len(self.sites) > 1:
-            try_step = self.sites[1] - self.sites[0]
+        if len(gids) > 1:
+            try_step = int(gids[1] - gids[0])
         else:
             try_step = 1
-        try_slice = slice(self.sites[0], self.sites[-1] + 1, try_step)
-        try_list = list(range(*try_slice.indices(try_slice.stop)))
 
-        if self.sites == try_list:
+        # sites are sequential if every step matches the first step, checked
+        # without materializing the equivalent range as a list. The span of
+        # the end points is an O(1) quick reject before the full diff check.
+        span = int(gids[-1] - gids[0])
+        sequential = (try_step > 0
+                      and span == try_step * (len(gids) - 1)
+                      and (np.diff(gids) == try_step).all())
+        if sequential:
             # try_slice is equivelant to the site list
-            sites_as_slice = try_slice
+            sites_as_slice = slice(int(gids[0]), int(gids[-1]) + 1, try_step)
         else:
             # cannot be converted to a sequential slice, return list
-            sites_as_slice = self.sites
+            sites_as_slice = gids.tolist()
 
         return sites_as_slice
 
@@ -649,10 +722,6 @@ class ProjectPoints:
             solarwaterheat, troughphysicalheat, lineardirectsteam)
             The string should be lower-cased with spaces and _ removed.
         """
-        tech = self._tech
-        if 'wind' in tech.lower():
-            tech = 'windpower'
-
         return self._tech
 
     @property
@@ -668,8 +737,12 @@ class ProjectPoints:
         h_var = 'wind_turbine_hub_ht'
         if self._h is None:
             if 'wind' in self.tech:
-                # wind technology, get a list of h values
-                self._h = [self[site][1][h_var] for site in self.sites]
+                # wind technology, get a list of h values. Read the configs
+                # directly instead of via __getitem__ to avoid a deepcopy of
+                # the full SAM config for every site.
+                sam_configs = self.sam_configs
+                self._h = [sam_configs[config_id][h_var]
+                           for config_id in self.df['config'].values]
 
         return self._h
 
@@ -745,6 +818,8 @@ class ProjectPoints:
         df2_cols = [c for c in df2.columns if c not in self._df or c == key]
         self._df = pd.merge(self._df, df2[df2_cols], how='left', left_on='gid',
                             right_on=key, copy=False, validate='1:1')
+        self._gid_config_map = None
+        self._gid_index_map = None
 
     def get_sites_from_config(self, config):
         """Get a site list that corresponds to a config key.
@@ -761,8 +836,10 @@ class ProjectPoints:
             the configuration ID is not recognized, an empty list is returned.
         """
 
-        sites = self.df.loc[(self.df['config'] == config), 'gid'].values
-        return list(sites)
+        mask = self.df['config'].values == config
+        sites = self.df['gid'].values[mask].tolist()
+
+        return sites
 
     @classmethod
     def split(cls, i0, i1, project_points):
@@ -798,11 +875,17 @@ class ProjectPoints:
 
         points_df = project_points.df.iloc[i0:i1]
 
-        # make a new instance of ProjectPoints with subset DF
-        sub = cls(points_df,
-                  project_points.sam_config_obj,
-                  project_points.tech,
-                  curtailment=project_points.curtailment)
+        # make a new instance of ProjectPoints with subset DF. The parent
+        # points have already been parsed, sorted, and checked against the
+        # SAM configs, so skip re-running __init__ for every split
+        sub = cls.__new__(cls)
+        sub._gid_config_map = None
+        sub._gid_index_map = None
+        sub._df = points_df
+        sub._sam_config_obj = project_points.sam_config_obj
+        sub._tech = project_points.tech
+        sub._h = None
+        sub._curtailment = project_points.curtailment
 
         return sub
 
@@ -3,11 +3,8 @@
 reV configuration framework for SAM config inputs.
 """
 import logging
-import os
 from warnings import warn
 
-from rex.utilities import safe_json_load
-
 from reV.utilities.exceptions import SAMInputError, SAMInputWarning
 from reV.config.base_config import BaseConfig
 
@@ -44,10 +41,8 @@ class SAMConfig(BaseConfig):
             Defaults to False (normal all-sky irradiance).
         """
         if self._clearsky is None:
-            self._clearsky = False
-            for v in self.inputs.values():
-                self._clearsky = any((self._clearsky,
-                                      bool(v.get('clearsky', False))))
+            self._clearsky = any(bool(v.get('clearsky', False))
+                                 for v in self.inputs.values())
 
             if self._clearsky:
                 logger.debug('Solar analysis being performed on clearsky '
@@ -67,10 +62,8 @@ class SAMConfig(BaseConfig):
             Defaults to False (no bifacial panels is default).
         """
         if self._bifacial is None:
-            self._bifacial = False
-            for v in self.inputs.values():
-                self._bifacial = any((self._bifacial,
-                                      bool(v.get('bifaciality', False))))
+            self._bifacial = any(bool(v.get('bifaciality', False))
+                                 for v in self.inputs.values())
 
         return self._bifacial
 
@@ -85,10 +78,8 @@ class SAMConfig(BaseConfig):
             Based on whether SAM input json has "en_icing_cutoff" == 1.
         """
         if self._icing is None:
-            self._icing = False
-            for v in self.inputs.values():
-                self._icing = any((self._icing,
-                                   bool(v.get('en_icing_cutoff', False))))
+            self._icing = any(bool(v.get('en_icing_cutoff', False))
+                              for v in self.inputs.values())
 
             if self._icing:
                 logger.debug('Icing analysis active for wind gen.')
@@ -106,11 +97,8 @@ class SAMConfig(BaseConfig):
             Step size for time_index, used to reduce temporal resolution
         """
         if self._time_index_step is None:
-            time_index_step = []
-            for v in self.inputs.values():
-                time_index_step.append(v.get('time_index_step', None))
-
-            self._time_index_step = list(set(time_index_step))
+            self._time_index_step = list({v.get('time_index_step', None)
+                                          for v in self.inputs.values()})
 
         if len(self._time_index_step) > 1:
             msg = ('Expecting a single unique value for "time_index_step" but '
@@ -133,11 +121,8 @@ class SAMConfig(BaseConfig):
             e.g. '5min'.
         """
         if self._downscale is None:
-            downscale = []
-            for v in self.inputs.values():
-                downscale.append(v.get('downscale', None))
-
-            self._downscale = list(set(downscale))
+            self._downscale = list({v.get('downscale', None)
+                                    for v in self.inputs.values()})
 
         if len(self._downscale) > 1:
             msg = ('Expecting a single unique value for "downscale" but '
@@ -162,14 +147,21 @@ class SAMConfig(BaseConfig):
             for key, fname in self.items():
                 # key is ID (i.e. sam_param_0) that matches project points json
                 # fname is the actual SAM config file name (with path)
-                if fname.endswith('.json') is True:
-                    if os.path.exists(fname):
-                        config = safe_json_load(fname)
-                        SAMInputsChecker.check(config)
-                        self._inputs[key] = config
-                    else:
+                if fname.endswith('.json'):
+                    # get_file checks existence with the same stat call
+                    # that keys the parsed file cache
+                    try:
+                        config = self.get_file(fname)
+                    except FileNotFoundError:
                         raise IOError('SAM inputs file does not exist: "{}"'
                                       .format(fname))
+
+                    # parsed files are cached and shared between SAMConfig
+                    # instances, copy so that in-place input updates (e.g.
+                    # PySAM key renames) stay local
+                    config = dict(config)
+                    SAMInputsChecker.check(config)
+                    self._inputs[key] = config
                 else:
                     raise IOError('SAM inputs file must be a JSON: "{}"'
                                   .format(fname))
@@ -15,7 +15,8 @@ from reV.config.sam_analysis_configs import EconConfig
 from reV.econ.econ import Econ
 from reV.generation.cli_gen import get_node_name_fout, make_fout
 from reV.pipeline.status import Status
-from reV.utilities.cli_dtypes import SAMFILES, PROJECTPOINTS
+from reV.utilities.cli_dtypes import (SAMFILES, PROJECTPOINTS,
+                                      EXISTINGFILE)
 
 from rex.utilities.cli_dtypes import INT, STR, INTLIST, STRLIST
 from rex.utilities.hpc import SLURM
@@ -48,7 +49,7 @@ def valid_config_keys():
 
 @main.command()
 @click.option('--config_file', '-c', required=True,
-              type=click.Path(exists=True),
+              type=EXISTINGFILE,
               help='reV econ configuration json file.')
 @click.option('-v', '--verbose', is_flag=True,
               help='Flag to turn on debug logging. Default is not verbose.')
@@ -56,7 +57,7 @@ def valid_config_keys():
 def from_config(ctx, config_file, verbose):
     """Run reV econ from a config file."""
     name = ctx.obj['NAME']
-    verbose = any([verbose, ctx.obj['VERBOSE']])
+    verbose = verbose or ctx.obj['VERBOSE']
 
     # Instantiate the config object
     config = EconConfig(config_file)
@@ -71,8 +72,7 @@ def from_config(ctx, config_file, verbose):
         verbose = True
 
     # make output directory if does not exist
-    if not os.path.exists(config.dirout):
-        os.makedirs(config.dirout)
+    os.makedirs(config.dirout, exist_ok=True)
 
     # initialize loggers.
     init_mult(name, config.logdir, modules=[__name__, 'reV.econ.econ',
@@ -236,7 +236,7 @@ def direct(ctx, sam_files, cf_file, year, points, site_data,
     ctx.obj['LOGDIR'] = logdir
     ctx.obj['OUTPUT_REQUEST'] = output_request
     ctx.obj['APPEND'] = append
-    verbose = any([verbose, ctx.obj['VERBOSE']])
+    verbose = verbose or ctx.obj['VERBOSE']
 
 
 @direct.command()
@@ -266,7 +266,7 @@ def local(ctx, max_workers, timeout, points_range, verbose):
     logdir = ctx.obj['LOGDIR']
     output_request = ctx.obj['OUTPUT_REQUEST']
     append = ctx.obj['APPEND']
-    verbose = any([verbose, ctx.obj['VERBOSE']])
+    verbose = verbose or ctx.obj['VERBOSE']
 
     if append:
         fout = os.path.basename(cf_file)
@@ -484,7 +484,7 @@ def slurm(ctx, nodes, alloc, memory, walltime, feature, module, conda_env,
     logdir = ctx.obj['LOGDIR']
     output_request = ctx.obj['OUTPUT_REQUEST']
     append = ctx.obj['APPEND']
-    verbose = any([verbose, ctx.obj['VERBOSE']])
+    verbose = verbose or ctx.obj['VERBOSE']
 
     # initialize a logger on the year level
     log_modules = [__name__, 'reV.econ.econ', 'reV.config', 'reV.utilities',
@@ -154,10 +154,11 @@ class Econ(BaseGen):
             Meta data from capacity factor outputs file.
         """
         if self._meta is None and self.cf_file is not None:
+            gids = self.points_control.project_points.df['gid'].values
             with Outputs(self.cf_file) as cfh:
                 # only take meta that belongs to this project's site list
-                self._meta = cfh.meta[
-                    cfh.meta['gid'].isin(self.points_control.sites)]
+                meta = cfh.meta
+                self._meta = meta[np.isin(meta['gid'].values, gids)]
 
             if 'offshore' in self._meta:
                 if self._meta['offshore'].sum() > 1:
@@ -485,12 +486,16 @@ class Econ(BaseGen):
 
         logger.info('Running econ with smart data flushing '
                     'for: {}'.format(pc))
-        logger.debug('The following project points were specified: "{}"'
-                     .format(points))
-        logger.debug('The following SAM configs are available to this run:\n{}'
-                     .format(pprint.pformat(sam_files, indent=4)))
-        logger.debug('The SAM output variables have been requested:\n{}'
-                     .format(output_request))
+        if logger.isEnabledFor(logging.DEBUG):
+            # points and sam_files can be very large, only format them for
+            # debug logging
+            logger.debug('The following project points were specified: "{}"'
+                         .format(points))
+            logger.debug('The following SAM configs are available to this '
+                         'run:\n{}'
+                         .format(pprint.pformat(sam_files, indent=4)))
+            logger.debug('The SAM output variables have been requested:\n{}'
+                         .format(output_request))
 
         try:
             kwargs['econ_fun'] = econ._fun
@@ -3,13 +3,16 @@
 reV base gen and econ module.
 """
 from abc import ABC, abstractmethod
+from collections import deque
 from concurrent.futures import TimeoutError
+from functools import lru_cache
 import logging
 import pandas as pd
 import numpy as np
 import os
 import psutil
 import sys
+import time
 from warnings import warn
 
 from reV.config.project_points import ProjectPoints, PointsControl
@@ -25,6 +28,43 @@ from rex.utilities.execution import SpawnProcessPool
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=16)
+def _res_site_chunk(res_file, mtime):
+    """Get the nominal site-axis chunk size of a resource file.
+
+    Parameters
+    ----------
+    res_file : str
+        Filepath to single resource file.
+    mtime : float
+        Resource file modification time. Part of the cache key so that a
+        modified file is re-read.
+
+    Returns
+    -------
+    chunk : int | None
+        Site-axis chunk size of the windspeed (WTK) or dni (NSRDB) dataset.
+        None if the chunk size cannot be determined.
+    """
+    chunks = None
+    name = res_file.lower()
+    with Resource(res_file) as res:
+        if 'wtk' in name:
+            for dset in res.datasets:
+                if 'speed' in dset:
+                    # take nominal WTK chunks from windspeed
+                    _, _, chunks = res.get_dset_properties(dset)
+                    break
+        elif 'nsrdb' in name:
+            # take nominal NSRDB chunks from dni
+            _, _, chunks = res.get_dset_properties('dni')
+        else:
+            warn('Expected "nsrdb" or "wtk" to be in resource filename: {}'
+                 .format(res_file))
+
+    return None if chunks is None else chunks[1]
+
+
 class BaseGen(ABC):
     """Base class for reV gen and econ classes to run SAM simulations."""
 
@@ -626,29 +666,16 @@ class BaseGen(ABC):
         if not res_file or not os.path.isfile(res_file):
             return default
 
-        with Resource(res_file) as res:
-            if 'wtk' in res_file.lower():
-                for dset in res.datasets:
-                    if 'speed' in dset:
-                        # take nominal WTK chunks from windspeed
-                        _, _, chunks = res.get_dset_properties(dset)
-                        break
-            elif 'nsrdb' in res_file.lower():
-                # take nominal NSRDB chunks from dni
-                _, _, chunks = res.get_dset_properties('dni')
-            else:
-                warn('Expected "nsrdb" or "wtk" to be in resource filename: {}'
-                     .format(res_file))
-                chunks = None
+        chunk = _res_site_chunk(res_file, os.path.getmtime(res_file))
 
-        if chunks is None:
+        if chunk is None:
             # if chunks not set, go to default
             sites_per_worker = default
             logger.debug('Sites per worker being set to {} (default) based on '
                          'no set chunk size in {}.'
                          .format(sites_per_worker, res_file))
         else:
-            sites_per_worker = chunks[1]
+            sites_per_worker = chunk
             logger.debug('Sites per worker being set to {} based on chunk '
                          'size of {}.'.format(sites_per_worker, res_file))
 
@@ -858,8 +885,7 @@ class BaseGen(ABC):
 
             # create and use optional output dir
             if self._dirout:
-                if not os.path.exists(self._dirout):
-                    os.makedirs(self._dirout)
+                os.makedirs(self._dirout, exist_ok=True)
 
                 # Add output dir to fout string
                 self._fpath = os.path.join(self._dirout, self._fout)
@@ -939,11 +965,11 @@ class BaseGen(ABC):
                                             len(self.project_points) - 1)))
         self._out_n_sites = int(self.out_chunk[1] - self.out_chunk[0]) + 1
 
+        gids = self.project_points.df['gid'].values
         logger.info('Initializing in-memory outputs for {} sites with gids '
                     '{} through {} inclusive (site list index {} through {})'
                     .format(self._out_n_sites,
-                            self.project_points.sites[self.out_chunk[0]],
-                            self.project_points.sites[self.out_chunk[1]],
+                            gids[self.out_chunk[0]], gids[self.out_chunk[1]],
                             self.out_chunk[0], self.out_chunk[1]))
 
         for request in self.output_request:
@@ -1019,7 +1045,7 @@ class BaseGen(ABC):
         """
 
         # get the index for site_gid in the (global) project points site list.
-        global_site_index = self.project_points.sites.index(site_gid)
+        global_site_index = self.project_points.index(site_gid)
 
         if not out_index:
             output_index = global_site_index
@@ -1081,21 +1107,19 @@ class BaseGen(ABC):
         N : int
             Total number of points control split instances.
         pc_chunks : list
-            List of lists of points control split instances.
+            List of lists of (inclusive, exclusive) project points index
+            ranges, one range per points control split instance. The split
+            instances are only built when their chunk is run so that the
+            full set of splits is never held in memory at once.
         """
-        N = 0
-        pc_chunks = []
-        i_chunk = []
-
-        for i, split in enumerate(self.points_control):
-            N += 1
-            i_chunk.append(split)
-            if (i + 1) % pool_size == 0:
-                pc_chunks.append(i_chunk)
-                i_chunk = []
+        ilim = len(self.project_points)
+        step = self.points_control.sites_per_split
+        split_ranges = [(i0, min(i0 + step, ilim))
+                        for i0 in range(0, ilim, step)]
 
-        if i_chunk:
-            pc_chunks.append(i_chunk)
+        N = len(split_ranges)
+        pc_chunks = [split_ranges[i:i + pool_size]
+                     for i in range(0, N, pool_size)]
 
         logger.debug('Pre-splitting points control into {} chunks with the '
                      'following chunk sizes: {}'
@@ -1123,6 +1147,8 @@ class BaseGen(ABC):
         logger.debug('Running parallel execution with max_workers={}'
                      .format(max_workers))
         i = 0
+        mem = None
+        mem_time = 0
         N, pc_chunks = self._pre_split_pc(pool_size=pool_size)
         for j, pc_chunk in enumerate(pc_chunks):
             logger.debug('Starting process pool for points control '
@@ -1131,28 +1157,41 @@ class BaseGen(ABC):
 
             failed_futures = False
             chunks = {}
-            futures = []
+            futures = deque()
             loggers = [__name__, 'reV.gen', 'reV.econ', 'reV']
             with SpawnProcessPool(max_workers=max_workers,
                                   loggers=loggers) as exe:
-                for pc in pc_chunk:
+                for i0, i1 in pc_chunk:
+                    pc = PointsControl.split(
+                        i0, i1, self.project_points,
+                        sites_per_split=self.points_control.sites_per_split)
                     future = exe.submit(self.run, pc, **kwargs)
                     futures.append(future)
                     chunks[future] = pc
 
-                for future in futures:
+                # consume in submission order (required by the output
+                # flush) but drop each future as it is consumed so that
+                # finished results are not held until the pool closes
+                while futures:
                     i += 1
+                    future = futures.popleft()
+                    pc = chunks.pop(future)
                     try:
                         result = future.result(timeout=timeout)
                     except TimeoutError:
                         failed_futures = True
-                        sites = chunks[future].project_points.sites
+                        sites = pc.project_points.sites
                         result = self._handle_failed_future(future, i, sites,
                                                             timeout)
 
                     self.out = result
 
-                    mem = psutil.virtual_memory()
+                    # finished futures are often consumed in quick
+                    # succession, only re-read system memory once a second
+                    if time.monotonic() - mem_time > 1:
+                        mem = psutil.virtual_memory()
+                        mem_time = time.monotonic()
+
                     m = ('Parallel run at iteration {0} out of {1}. '
                          'Memory utilization is {2:.3f} GB out of {3:.3f} GB '
                          'total ({4:.1f}% used, intended limit of {5:.1f}%)'
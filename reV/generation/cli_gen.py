@@ -16,7 +16,8 @@ from reV.config.sam_analysis_configs import GenConfig
 from reV.generation.generation import Gen
 from reV.pipeline.status import Status
 from reV.utilities.exceptions import ConfigError, ProjectPointsValueError
-from reV.utilities.cli_dtypes import SAMFILES, PROJECTPOINTS
+from reV.utilities.cli_dtypes import (SAMFILES, PROJECTPOINTS,
+                                      EXISTINGFILE)
 
 from rex.utilities.cli_dtypes import INT, STR, INTLIST, STRLIST
 from rex.utilities.hpc import SLURM
@@ -49,7 +50,7 @@ def valid_config_keys():
 
 @main.command()
 @click.option('--config_file', '-c', required=True,
-              type=click.Path(exists=True),
+              type=EXISTINGFILE,
               help='reV generation configuration json file.')
 @click.option('-v', '--verbose', is_flag=True,
               help='Flag to turn on debug logging. Default is not verbose.')
@@ -57,7 +58,7 @@ def valid_config_keys():
 def from_config(ctx, config_file, verbose):
     """Run reV gen from a config file."""
     name = ctx.obj['NAME']
-    verbose = any([verbose, ctx.obj['VERBOSE']])
+    verbose = verbose or ctx.obj['VERBOSE']
 
     # Instantiate the config object
     config = GenConfig(config_file)
@@ -72,8 +73,7 @@ def from_config(ctx, config_file, verbose):
         verbose = True
 
     # make output directory if does not exist
-    if not os.path.exists(config.dirout):
-        os.makedirs(config.dirout)
+    os.makedirs(config.dirout, exist_ok=True)
 
     # initialize loggers.
     init_mult(name, config.logdir,
@@ -298,7 +298,7 @@ def direct(ctx, tech, sam_files, res_file, points, lat_lon_fpath,
     ctx.obj['REGION'] = region
     ctx.obj['REGION_COL'] = region_col
 
-    verbose = any([verbose, ctx.obj['VERBOSE']])
+    verbose = verbose or ctx.obj['VERBOSE']
 
 
 def _parse_points(ctx):
@@ -390,7 +390,7 @@ def local(ctx, max_workers, timeout, points_range, verbose):
     site_data = ctx.obj['SITE_DATA']
     mem_util_lim = ctx.obj['MEM_UTIL_LIM']
     curtailment = ctx.obj['CURTAILMENT']
-    verbose = any([verbose, ctx.obj['VERBOSE']])
+    verbose = verbose or ctx.obj['VERBOSE']
 
     # initialize loggers for multiple modules
     init_mult(name, logdir, modules=[__name__, 'reV.generation.generation',
@@ -670,7 +670,7 @@ def slurm(ctx, nodes, alloc, memory, walltime, feature, conda_env, module,
     mem_util_lim = ctx.obj['MEM_UTIL_LIM']
     timeout = ctx.obj['TIMEOUT']
     curtailment = ctx.obj['CURTAILMENT']
-    verbose = any([verbose, ctx.obj['VERBOSE']])
+    verbose = verbose or ctx.obj['VERBOSE']
 
     # initialize a logger on the year level
     log_modules = [__name__, 'reV.generation.generation', 'reV.config',
@@ -300,17 +300,17 @@ class Gen(BaseGen):
             with res_cls(self.res_file, **kwargs) as res:
                 res_meta = res.meta
 
-            if np.max(self.project_points.sites) > len(res_meta):
+            sites = self.project_points.df['gid'].values
+            if np.max(sites) > len(res_meta):
                 msg = ('ProjectPoints has a max site gid of {} which is '
                        'out of bounds for the meta data of size {} from '
                        'resource file: {}'
-                       .format(np.max(self.project_points.sites),
-                               res_meta.shape, self.res_file))
+                       .format(np.max(sites), res_meta.shape, self.res_file))
                 logger.error(msg)
                 raise ProjectPointsValueError(msg)
 
-            self._meta = res_meta.iloc[self.project_points.sites, :]
-            self._meta.loc[:, 'gid'] = self.project_points.sites
+            self._meta = res_meta.iloc[sites, :]
+            self._meta.loc[:, 'gid'] = sites
             self._meta.loc[:, 'reV_tech'] = self.project_points.tech
 
         return self._meta
@@ -556,12 +556,16 @@ class Gen(BaseGen):
                   'scale_outputs': scale_outputs}
 
         logger.info('Running reV generation for: {}'.format(pc))
-        logger.debug('The following project points were specified: "{}"'
-                     .format(points))
-        logger.debug('The following SAM configs are available to this run:\n{}'
-                     .format(pprint.pformat(sam_files, indent=4)))
-        logger.debug('The SAM output variables have been requested:\n{}'
-                     .format(output_request))
+        if logger.isEnabledFor(logging.DEBUG):
+            # points and sam_files can be very large, only format them for
+            # debug logging
+            logger.debug('The following project points were specified: "{}"'
+                         .format(points))
+            logger.debug('The following SAM configs are available to this '
+                         'run:\n{}'
+                         .format(pprint.pformat(sam_files, indent=4)))
+            logger.debug('The SAM output variables have been requested:\n{}'
+                         .format(output_request))
 
         # use serial or parallel execution control based on max_workers
         try:
@@ -11,6 +11,7 @@ import time
 from reV.config.collection import CollectionConfig
 from reV.handlers.collection import Collector
 from reV.pipeline.status import Status
+from reV.utilities.cli_dtypes import EXISTINGFILE
 
 from rex.utilities.cli_dtypes import STR, STRLIST, INT
 from rex.utilities.hpc import SLURM
@@ -43,7 +44,7 @@ def valid_config_keys():
 
 @main.command()
 @click.option('--config_file', '-c', required=True,
-              type=click.Path(exists=True),
+              type=EXISTINGFILE,
               help='reV collection configuration json file.')
 @click.option('-v', '--verbose', is_flag=True,
               help='Flag to turn on debug logging. Default is not verbose.')
@@ -65,8 +66,7 @@ def from_config(ctx, config_file, verbose):
         verbose = True
 
     # make output directory if does not exist
-    if not os.path.exists(config.dirout):
-        os.makedirs(config.dirout)
+    os.makedirs(config.dirout, exist_ok=True)
 
     # initialize loggers.
     init_mult(name, config.logdir,
@@ -167,7 +167,7 @@ def collect(ctx, verbose):
     file_prefix = ctx.obj['FILE_PREFIX']
     log_dir = ctx.obj['LOG_DIR']
     purge_chunks = ctx.obj['PURGE_CHUNKS']
-    verbose = any([verbose, ctx.obj['VERBOSE']])
+    verbose = verbose or ctx.obj['VERBOSE']
 
     # initialize loggers for multiple modules
     init_mult(name, log_dir, modules=[__name__, 'reV.handlers.collection'],
@@ -297,7 +297,7 @@ def collect_slurm(ctx, alloc, memory, walltime, feature, conda_env, module,
     dsets = ctx.obj['DSETS']
     file_prefix = ctx.obj['FILE_PREFIX']
     purge_chunks = ctx.obj['PURGE_CHUNKS']
-    verbose = any([verbose, ctx.obj['VERBOSE']])
+    verbose = verbose or ctx.obj['VERBOSE']
 
     slurm_manager = ctx.obj.get('SLURM_MANAGER', None)
     if slurm_manager is None:
@@ -11,6 +11,7 @@ import time
 from reV.config.multi_year import MultiYearConfig
 from reV.handlers.multi_year import MultiYear
 from reV.pipeline.status import Status
+from reV.utilities.cli_dtypes import EXISTINGFILE
 
 from rex.utilities.cli_dtypes import STR, STRLIST, PATHLIST, INT
 from rex.utilities.loggers import init_mult
@@ -43,7 +44,7 @@ def valid_config_keys():
 
 @main.command()
 @click.option('--config_file', '-c', required=True,
-              type=click.Path(exists=True),
+              type=EXISTINGFILE,
               help='reV multi-year configuration json file.')
 @click.option('-v', '--verbose', is_flag=True,
               help='Flag to turn on debug logging. Default is not verbose.')
@@ -65,8 +66,7 @@ def from_config(ctx, config_file, verbose):
         verbose = True
 
     # make output directory if does not exist
-    if not os.path.exists(config.dirout):
-        os.makedirs(config.dirout)
+    os.makedirs(config.dirout, exist_ok=True)
 
     # initialize loggers.
     init_mult(name, config.logdir,
@@ -136,7 +136,7 @@ def multi_year(ctx, group, source_files, dsets, verbose):
 
     name = ctx.obj['NAME']
     my_file = ctx.obj['MY_FILE']
-    verbose = any([verbose, ctx.obj['VERBOSE']])
+    verbose = verbose or ctx.obj['VERBOSE']
 
     # initialize loggers for multiple modules
     log_dir = os.path.dirname(my_file)
@@ -185,7 +185,7 @@ def multi_year_groups(ctx, group_params, verbose):
     """Run multi year collection and means for multiple groups."""
     name = ctx.obj['NAME']
     my_file = ctx.obj['MY_FILE']
-    verbose = any([verbose, ctx.obj['VERBOSE']])
+    verbose = verbose or ctx.obj['VERBOSE']
 
     # initialize loggers for multiple modules
     log_dir = os.path.dirname(my_file)
@@ -301,7 +301,7 @@ def multi_year_slurm(ctx, alloc, walltime, feature, memory, conda_env,
 
     name = ctx.obj['NAME']
     my_file = ctx.obj['MY_FILE']
-    verbose = any([verbose, ctx.obj['VERBOSE']])
+    verbose = verbose or ctx.obj['VERBOSE']
 
     slurm_manager = ctx.obj.get('SLURM_MANAGER', None)
     if slurm_manager is None:
@@ -175,23 +175,25 @@ class DatasetCollector:
             indexes is returned and a warning is printed.
         """
 
-        locs = np.where(np.isin(gids_out, source_gids))[0]
-        if not any(locs):
+        mask = np.isin(gids_out, source_gids)
+        locs = np.flatnonzero(mask)
+        if not locs.size:
             e = ('DatasetCollector could not locate source gids in '
                  'output gids. \n\t Source gids: {} \n\t Output gids: {}'
                  .format(source_gids, gids_out))
             logger.error(e)
             raise CollectionRuntimeError(e)
-        sequential_locs = np.arange(locs.min(), locs.max() + 1)
 
-        if not len(locs) == len(sequential_locs):
+        # locs are sorted and unique so they are sequential if and only if
+        # their span matches their count
+        if locs[-1] - locs[0] + 1 != len(locs):
             w = ('GID indices for source file "{}" are not '
                  'sequential in destination file!'.format(fn_source))
             logger.warning(w)
             warn(w, CollectionWarning)
-            site_slice = np.isin(gids_out, source_gids)
+            site_slice = mask
         else:
-            site_slice = slice(locs.min(), locs.max() + 1)
+            site_slice = slice(locs[0], locs[-1] + 1)
 
         return site_slice
 
@@ -435,12 +437,15 @@ class Collector:
             if step is None:
                 step = 1
 
-            gids = list(range(s, e, step))
+            gids = np.arange(s, e, step)
         else:
             m = 'Cannot parse project_points'
             logger.error(m)
             raise CollectionValueError(m)
-        gids = sorted([int(g) for g in gids])
+
+        # sort as an int array and convert to python ints in one pass
+        gids = np.sort(np.array(gids, dtype=np.int64)).tolist()
+
         return gids
 
     @staticmethod
@@ -595,8 +600,7 @@ class Collector:
             for fpath in self.h5_files:
                 base_dir, fn = os.path.split(fpath)
                 new_dir = os.path.join(base_dir, sub_dir)
-                if not os.path.exists(new_dir):
-                    os.makedirs(new_dir)
+                os.makedirs(new_dir, exist_ok=True)
                 new_fpath = os.path.join(new_dir, fn)
                 shutil.move(fpath, new_fpath)
 
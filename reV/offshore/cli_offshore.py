@@ -17,7 +17,8 @@ import time
 from reV.config.offshore_config import OffshoreConfig
 from reV.pipeline.status import Status
 from reV.offshore.offshore import Offshore
-from reV.utilities.cli_dtypes import SAMFILES, PROJECTPOINTS
+from reV.utilities.cli_dtypes import (SAMFILES, PROJECTPOINTS,
+                                      EXISTINGFILE)
 
 from rex.utilities.cli_dtypes import STR, INT
 from rex.utilities.loggers import init_mult
@@ -50,7 +51,7 @@ def valid_config_keys():
 
 @main.command()
 @click.option('--config_file', '-c', required=True,
-              type=click.Path(exists=True),
+              type=EXISTINGFILE,
               help='reV offshore configuration json file.')
 @click.option('-v', '--verbose', is_flag=True,
               help='Flag to turn on debug logging. Default is not verbose.')
@@ -489,8 +489,7 @@ class Offshore:
         if sub_dir is not None:
             base_dir, fn = os.path.split(self._gen_fpath)
             new_dir = os.path.join(base_dir, sub_dir)
-            if not os.path.exists(new_dir):
-                os.makedirs(new_dir)
+            os.makedirs(new_dir, exist_ok=True)
             new_fpath = os.path.join(new_dir, fn)
             shutil.move(self._gen_fpath, new_fpath)
 
@@ -778,10 +777,13 @@ class Offshore:
 
                     futures[future] = i
 
+            # pop collected futures so their results can be freed as soon
+            # as they are unpacked
+            n_futures = len(futures)
             for fi, future in enumerate(as_completed(futures)):
                 logger.info('Completed {} out of {} offshore compute futures.'
-                            .format(fi + 1, len(futures)))
-                i = futures[future]
+                            .format(fi + 1, n_futures))
+                i = futures.pop(future)
                 gen_data = future.result()
                 for k, v in gen_data.items():
                     if isinstance(v, (np.ndarray, list, tuple)):
@@ -6,6 +6,7 @@ import click
 
 from reV.config.pipeline import PipelineConfig
 from reV.pipeline.pipeline import Pipeline
+from reV.utilities.cli_dtypes import EXISTINGFILE
 
 from rex.utilities.cli_dtypes import STR
 from rex.utilities.utilities import get_class_properties
@@ -35,7 +36,7 @@ def valid_config_keys():
 
 @main.command()
 @click.option('--config_file', '-c', required=True,
-              type=click.Path(exists=True),
+              type=EXISTINGFILE,
               help='reV pipeline configuration json file.')
 @click.option('--cancel', is_flag=True,
               help='Flag to cancel all jobs associated with a given pipeline.')
@@ -52,7 +53,7 @@ def valid_config_keys():
 @click.pass_context
 def from_config(ctx, config_file, cancel, monitor, background, verbose):
     """Run reV pipeline from a config file."""
-    verbose = any([verbose, ctx.obj['VERBOSE']])
+    verbose = verbose or ctx.obj['VERBOSE']
 
     if cancel:
         Pipeline.cancel_all(config_file)
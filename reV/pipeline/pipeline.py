@@ -9,11 +9,11 @@ import logging
 from warnings import warn
 
 from reV.config.base_analysis_config import AnalysisConfig
+from reV.config.base_config import BaseConfig
 from reV.config.pipeline import PipelineConfig
 from reV.pipeline.status import Status
 from reV.utilities.exceptions import ExecutionError
 
-from rex.utilities import safe_json_load
 from rex.utilities.execution import SubprocessManager
 from rex.utilities.hpc import SLURM
 from rex.utilities.loggers import init_logger
@@ -209,7 +209,7 @@ class Pipeline:
             reV analysis config object.
         """
 
-        config_dict = safe_json_load(f_config)
+        config_dict = BaseConfig.get_file(f_config)
         return AnalysisConfig(config_dict, check_keys=False)
 
     def _get_status_obj(self):
@@ -103,8 +103,7 @@ class Status(dict):
     def _dump(self):
         """Dump status json w/ backup file in case process gets killed."""
 
-        if not os.path.exists(os.path.dirname(self._fpath)):
-            os.makedirs(os.path.dirname(self._fpath))
+        os.makedirs(os.path.dirname(self._fpath), exist_ok=True)
 
         backup = self._fpath.replace('.json', '_backup.json')
         self._sort_by_index()
@@ -196,14 +195,12 @@ class Status(dict):
             Job status dictionary if completion file found.
         """
         status = None
-        target_fname = 'jobstatus_{}.json'.format(job_name)
-        for fname in os.listdir(status_dir):
-            if fname == target_fname:
-                # wait one second to make sure file is finished being written
-                time.sleep(0.01)
-                status = safe_json_load(os.path.join(status_dir, fname))
-                os.remove(os.path.join(status_dir, fname))
-                break
+        fpath = os.path.join(status_dir, 'jobstatus_{}.json'.format(job_name))
+        if os.path.exists(fpath):
+            # wait one second to make sure file is finished being written
+            time.sleep(0.01)
+            status = safe_json_load(fpath)
+            os.remove(fpath)
 
         return status
 
@@ -18,6 +18,7 @@ from reV.pipeline.status import Status
 from reV.qa_qc.qa_qc import QaQc
 from reV.qa_qc.summary import (SummarizeH5, SummarizeSupplyCurve,
                                SupplyCurvePlot, ExclusionsMask)
+from reV.utilities.cli_dtypes import EXISTINGFILE
 
 logger = logging.getLogger(__name__)
 
@@ -56,7 +57,7 @@ def summarize(ctx, out_dir, log_file, verbose):
     Summarize reV data
     """
     ctx.obj['OUT_DIR'] = out_dir
-    if any([verbose, ctx.obj['VERBOSE']]):
+    if verbose or ctx.obj['VERBOSE']:
         log_level = 'DEBUG'
     else:
         log_level = 'INFO'
@@ -199,7 +200,7 @@ def reV_h5(ctx, h5_file, out_dir, sub_dir, dsets, group, process_size,
     Summarize and plot data for reV h5_file
     """
     name = ctx.obj['NAME']
-    if any([verbose, ctx.obj['VERBOSE']]):
+    if verbose or ctx.obj['VERBOSE']:
         log_level = 'DEBUG'
     else:
         log_level = 'INFO'
@@ -252,7 +253,7 @@ def supply_curve(ctx, sc_table, out_dir, sub_dir, columns, plot_type, cmap,
     Summarize and plot reV Supply Curve data
     """
     name = ctx.obj['NAME']
-    if any([verbose, ctx.obj['VERBOSE']]):
+    if verbose or ctx.obj['VERBOSE']:
         log_level = 'DEBUG'
     else:
         log_level = 'INFO'
@@ -314,7 +315,7 @@ def exclusions(ctx, excl_fpath, out_dir, sub_dir, excl_dict,
     Extract and plot reV exclusions mask
     """
     name = ctx.obj['NAME']
-    if any([verbose, ctx.obj['VERBOSE']]):
+    if verbose or ctx.obj['VERBOSE']:
         log_level = 'DEBUG'
     else:
         log_level = 'INFO'
@@ -340,7 +341,7 @@ def exclusions(ctx, excl_fpath, out_dir, sub_dir, excl_dict,
 
 @main.command()
 @click.option('--config_file', '-c', required=True,
-              type=click.Path(exists=True),
+              type=EXISTINGFILE,
               help='reV QA/QC configuration json file.')
 @click.option('-v', '--verbose', is_flag=True,
               help='Flag to turn on debug logging. Default is not verbose.')
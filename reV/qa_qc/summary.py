@@ -244,8 +244,7 @@ class SummarizeH5:
             Number of workers to use when summarizing 2D datasets,
             by default None
         """
-        if not os.path.exists(out_dir):
-            os.makedirs(out_dir)
+        os.makedirs(out_dir, exist_ok=True)
 
         if dsets is None:
             with Resource(h5_file, group=group) as f:
@@ -388,8 +387,7 @@ class SummarizeSupplyCurve:
             Column(s) to summarize, if None summarize all numeric columns,
             by default None
         """
-        if not os.path.exists(out_dir):
-            os.makedirs(out_dir)
+        os.makedirs(out_dir, exist_ok=True)
 
         summary = cls(sc_table)
         out_path = os.path.basename(sc_table).replace('.csv', '_summary.csv')
@@ -11,6 +11,7 @@ import time
 from reV.config.rep_profiles_config import RepProfilesConfig
 from reV.pipeline.status import Status
 from reV.rep_profiles.rep_profiles import RepProfiles, AggregatedRepProfiles
+from reV.utilities.cli_dtypes import EXISTINGFILE
 
 from rex.utilities.hpc import SLURM
 from rex.utilities.cli_dtypes import STR, INT, STRLIST
@@ -43,7 +44,7 @@ def valid_config_keys():
 
 @main.command()
 @click.option('--config_file', '-c', required=True,
-              type=click.Path(exists=True),
+              type=EXISTINGFILE,
               help='reV representative profiles configuration json file.')
 @click.option('-v', '--verbose', is_flag=True,
               help='Flag to turn on debug logging. Default is not verbose.')
@@ -992,6 +992,12 @@ class RepProfiles(RepProfilesBase):
         logger.info('Kicking off {} rep profile futures.'
                     .format(len(self.meta)))
 
+        # only the gid and weight columns are used by the region profile
+        # calc, so avoid pickling the full summary table for every future
+        cols = [c for c in (self._gid_col, 'res_gids', self._weight)
+                if c in self._rev_summary]
+        rev_summary = self._rev_summary[list(dict.fromkeys(cols))]
+
         iter_chunks = np.array_split(self.meta.index.values,
                                      np.ceil(len(self.meta) / pool_size))
         n_complete = 0
@@ -1016,7 +1022,7 @@ class RepProfiles(RepProfilesBase):
                     else:
                         future = exe.submit(
                             RegionRepProfile.get_region_rep_profile,
-                            self._gen_fpath, self._rev_summary[mask],
+                            self._gen_fpath, rev_summary[mask],
                             gid_col=self._gid_col,
                             cf_dset=self._cf_dset,
                             rep_method=self._rep_method,
@@ -1027,7 +1033,7 @@ class RepProfiles(RepProfilesBase):
                         futures[future] = [i, region_dict]
 
                 for future in as_completed(futures):
-                    i, region_dict = futures[future]
+                    i, region_dict = futures.pop(future)
                     profiles, _, ggids, rgids = future.result()
                     n_complete += 1
                     logger.info('Future {} out of {} complete '
@@ -1199,7 +1205,35 @@ class AggregatedRepProfiles(RepProfilesBase):
 
             self._profiles[0][:, i] = profile.flatten()
 
-    def _run_parallel(self, max_workers=None, pool_size=72):
+    @staticmethod
+    def _get_batch_profiles(gen_fpath, rows, **kwargs):
+        """Compute the aggregate rep profiles for a batch of supply curve
+        points. Used to amortize the parallel overhead over many points.
+
+        Parameters
+        ----------
+        gen_fpath : str
+            Filepath to reV gen output file to extract "cf_profile" from.
+        rows : pd.DataFrame
+            Batch of rev summary rows, one per supply curve point.
+        kwargs : dict
+            Keyword arguments for RegionRepProfile.get_region_rep_profile.
+
+        Returns
+        -------
+        profiles : list
+            List of representative profile arrays, one per row in rows.
+        """
+        profiles = []
+        for i in rows.index:
+            row = pd.DataFrame(rows.loc[i, :]).T
+            profile = RegionRepProfile.get_region_rep_profile(
+                gen_fpath, row, **kwargs)[0]
+            profiles.append(profile)
+
+        return profiles
+
+    def _run_parallel(self, max_workers=None, pool_size=72, batch_size=100):
         """Compute all representative profiles in parallel.
 
         Parameters
@@ -1210,13 +1244,24 @@ class AggregatedRepProfiles(RepProfilesBase):
         pool_size : int
             Number of futures to submit to a single process pool for
             parallel futures.
+        batch_size : int
+            Number of supply curve points to compute profiles for in a
+            single parallel future.
         """
 
-        logger.info('Kicking off {} aggregate rep profile futures.'
-                    .format(len(self.meta)))
+        logger.info('Kicking off {} aggregate rep profile calculations in '
+                    'batches of {}.'.format(len(self.meta), batch_size))
 
-        iter_chunks = np.array_split(self.meta.index.values,
-                                     np.ceil(len(self.meta) / pool_size))
+        kwargs = {'gid_col': self._gid_col,
+                  'cf_dset': self._cf_dset,
+                  'rep_method': self._rep_method,
+                  'err_method': self._err_method,
+                  'weight': self._weight,
+                  'n_profiles': self._n_profiles}
+
+        iter_chunks = np.array_split(
+            self.meta.index.values,
+            np.ceil(len(self.meta) / (pool_size * batch_size)))
         n_complete = 0
         for iter_chunk in iter_chunks:
             logger.debug('Starting process pool...')
@@ -1224,30 +1269,25 @@ class AggregatedRepProfiles(RepProfilesBase):
             loggers = [__name__, 'reV']
             with SpawnProcessPool(max_workers=max_workers,
                                   loggers=loggers) as exe:
-                for i in iter_chunk:
-                    row = self.meta.loc[i, :]
-                    row = pd.DataFrame(row).T
-                    future = exe.submit(
-                        RegionRepProfile.get_region_rep_profile,
-                        self._gen_fpath, row,
-                        gid_col=self._gid_col,
-                        cf_dset=self._cf_dset,
-                        rep_method=self._rep_method,
-                        err_method=self._err_method,
-                        weight=self._weight,
-                        n_profiles=self._n_profiles)
-
-                    futures[future] = i
+                batches = np.array_split(
+                    iter_chunk, np.ceil(len(iter_chunk) / batch_size))
+                for batch in batches:
+                    future = exe.submit(self._get_batch_profiles,
+                                        self._gen_fpath,
+                                        self.meta.loc[batch, :], **kwargs)
+
+                    futures[future] = batch
 
                 for future in as_completed(futures):
-                    i = futures[future]
-                    profile = future.result()[0]
-                    n_complete += 1
-                    logger.info('Future {} out of {} complete.'
+                    batch = futures.pop(future)
+                    profiles = future.result()
+                    n_complete += len(batch)
+                    logger.info('Profiles {} out of {} complete.'
                                 .format(n_complete, len(self.meta)))
                     log_mem(logger, log_level='DEBUG')
 
-                    self._profiles[0][:, i] = profile.flatten()
+                    for i, profile in zip(batch, profiles):
+                        self._profiles[0][:, i] = profile.flatten()
 
     def _run(self, fout=None, scaled_precision=False,
              max_workers=None):
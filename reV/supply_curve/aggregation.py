@@ -668,17 +668,20 @@ class Aggregation(AbstractAggregation):
                         gen_index=gen_index)
 
                 except EmptySupplyCurvePointError:
-                    logger.debug('SC gid {} is fully excluded or does not '
-                                 'have any valid source data!'.format(gid))
+                    logger.debug('SC gid %s is fully excluded or does not '
+                                 'have any valid source data!', gid)
                 except Exception:
                     logger.exception('SC gid {} failed!'.format(gid))
                     raise
                 else:
                     n_finished += 1
+                    # per-point logging: defer formatting and skip the
+                    # memory query unless debug logging is enabled
                     logger.debug('Serial aggregation: '
-                                 '{} out of {} points complete'
-                                 .format(n_finished, len(gids)))
-                    log_mem(logger)
+                                 '%d out of %d points complete',
+                                 n_finished, len(gids))
+                    if logger.isEnabledFor(logging.DEBUG):
+                        log_mem(logger)
                     for k, v in gid_out.items():
                         agg_out[k].append(v)
 
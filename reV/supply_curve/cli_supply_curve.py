@@ -11,6 +11,7 @@ import time
 from reV.config.supply_curve_configs import SupplyCurveConfig
 from reV.pipeline.status import Status
 from reV.supply_curve.supply_curve import SupplyCurve
+from reV.utilities.cli_dtypes import EXISTINGFILE
 
 from rex.utilities.hpc import SLURM
 from rex.utilities.cli_dtypes import STR, INT
@@ -43,7 +44,7 @@ def valid_config_keys():
 
 @main.command()
 @click.option('--config_file', '-c', required=True,
-              type=click.Path(exists=True),
+              type=EXISTINGFILE,
               help='reV supply curve configuration json file.')
 @click.option('-v', '--verbose', is_flag=True,
               help='Flag to turn on debug logging. Default is not verbose.')
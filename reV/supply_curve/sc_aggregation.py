@@ -996,8 +996,8 @@ class SupplyCurveAggregation(AbstractAggregation):
                         summary.append(pointsum)
                         n_finished += 1
                         logger.debug('Serial aggregation: '
-                                     '{} out of {} points complete'
-                                     .format(n_finished, len(gids)))
+                                     '%d out of %d points complete',
+                                     n_finished, len(gids))
 
         return summary
 
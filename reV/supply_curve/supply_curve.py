@@ -455,9 +455,90 @@ class SupplyCurve:
 
         return trans_table, sc_gids, mask
 
+    @staticmethod
+    def _sc_table_chunks(trans_table, connectable=True, sc_point_chunk=1000):
+        """
+        Split the transmission table into chunks of supply curve points
+
+        Parameters
+        ----------
+        trans_table : pd.DataFrame
+            Table mapping supply curve points to transmission features
+            MUST contain supply curve point capacity
+        connectable : bool
+            Determine if connection is possible, if False capacities are None
+        sc_point_chunk : int
+            Maximum number of supply curve points in a single chunk.
+
+        Yields
+        ------
+        sc_tables : list
+            List of transmission tables (pd.DataFrame), one per supply curve
+            point, in sc_gid groupby order
+        capacities : list
+            Capacity of each supply curve point in MW, None if not
+            connectable
+        """
+        sc_tables = []
+        capacities = []
+        for sc_gid, sc_table in trans_table.groupby('sc_gid'):
+            capacity = None
+            if connectable:
+                capacity = sc_table['capacity'].unique()
+                if len(capacity) != 1:
+                    msg = ('Each supply curve point should only have '
+                           'a single capacity, but {} has {}'
+                           .format(sc_gid, capacity))
+                    logger.error(msg)
+                    raise RuntimeError(msg)
+
+                capacity = capacity[0]
+
+            sc_tables.append(sc_table)
+            capacities.append(capacity)
+            if len(sc_tables) == sc_point_chunk:
+                yield sc_tables, capacities
+                sc_tables = []
+                capacities = []
+
+        if sc_tables:
+            yield sc_tables, capacities
+
+    @staticmethod
+    def _compute_chunk_costs(sc_tables, capacities, line_limited=False,
+                             **trans_costs):
+        """
+        Compute transmission costs for a chunk of supply curve points
+
+        Parameters
+        ----------
+        sc_tables : list
+            List of transmission tables (pd.DataFrame), one per supply curve
+            point
+        capacities : list
+            Capacity of each supply curve point in MW, None entries DO NOT
+            check if connection is possible
+        line_limited : bool
+            Substation connection is limited by maximum capacity of the
+            attached lines, legacy method
+        trans_costs : dict
+            Transmission feature costs to use with TransmissionFeatures
+
+        Returns
+        -------
+        cost : ndarray
+            Cost of transmission in $/MW for all connections in sc_tables
+        """
+        cost = [TC.feature_costs(sc_table, capacity=capacity,
+                                 line_limited=line_limited, **trans_costs)
+                for sc_table, capacity in zip(sc_tables, capacities)]
+
+        return np.hstack(cost)
+
     @staticmethod
     def _compute_lcot(trans_table, fcr, trans_costs=None, max_workers=None,
-                      connectable=True, line_limited=False):
+                      connectable=True, line_limited=False,
+                      sc_point_chunk=1000):
         """
         Compute levelized cost of transmission for all combinations of
         supply curve points and tranmission features in trans_table
@@ -481,6 +562,9 @@ class SupplyCurve:
         line_limited : bool
             Substation connection is limited by maximum capacity of the
             attached lines, legacy method
+        sc_point_chunk : int
+            Number of supply curve points to compute costs for in a single
+            parallel future.
 
         Returns
         -------
@@ -506,29 +590,18 @@ class SupplyCurve:
 
         logger.info('Computing LCOT costs for all possible connections...')
         if max_workers > 1:
-            groups = trans_table.groupby('sc_gid')
+            chunks = SupplyCurve._sc_table_chunks(
+                trans_table, connectable=connectable,
+                sc_point_chunk=sc_point_chunk)
             loggers = [__name__, 'reV.handlers.transmission', 'reV']
             with SpawnProcessPool(max_workers=max_workers,
                                   loggers=loggers) as exe:
                 futures = []
-                for sc_gid, sc_table in groups:
-                    if connectable:
-                        capacity = sc_table['capacity'].unique()
-                        if len(capacity) == 1:
-                            capacity = capacity[0]
-                        else:
-                            msg = ('Each supply curve point should only have '
-                                   'a single capacity, but {} has {}'
-                                   .format(sc_gid, capacity))
-                            logger.error(msg)
-                            raise RuntimeError(msg)
-                    else:
-                        capacity = None
-
-                    futures.append(exe.submit(TC.feature_costs, sc_table,
-                                              capacity=capacity,
-                                              line_limited=line_limited,
-                                              **trans_costs))
+                for sc_tables, capacities in chunks:
+                    futures.append(exe.submit(
+                        SupplyCurve._compute_chunk_costs, sc_tables,
+                        capacities, line_limited=line_limited,
+                        **trans_costs))
 
                 cost = [future.result() for future in futures]
                 cost = np.hstack(cost)
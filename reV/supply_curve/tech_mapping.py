@@ -9,7 +9,7 @@ Created on Fri Jun 21 16:05:47 2019
 @author: gbuster
 """
 import h5py
-from concurrent.futures import as_completed
+from concurrent.futures import wait, FIRST_COMPLETED
 import numpy as np
 import os
 from scipy.spatial import cKDTree
@@ -207,9 +207,41 @@ class TechMapping:
 
         return coords_out, lat_range, lon_range
 
-    def _parallel_resource_map(self):
+    @staticmethod
+    def _store_result(result, gids, sc, ind_all, coords_all):
+        """Unpack a single map_resource_gids() result into the output arrays.
+
+        Parameters
+        ----------
+        result : tuple
+            Output of map_resource_gids(): (ind, coords) lists with entries
+            corresponding to gids.
+        gids : np.ndarray
+            Supply curve gids that were mapped to produce result.
+        sc : SupplyCurveExtent
+            reV supply curve extent object at the map chunk resolution.
+        ind_all : np.ndarray
+            1D full output array of NN resource indices, updated in place.
+        coords_all : np.ndarray
+            2D (N, 2) full output array of tech exclusion point coordinates,
+            updated in place.
+        """
+        for j, gid in enumerate(gids):
+            i_out_arr = sc.get_flat_excl_ind(gid)
+            ind_all[i_out_arr] = result[0][j]
+            coords_all[i_out_arr, :] = result[1][j]
+
+    def _parallel_resource_map(self, max_in_flight=None):
         """Map all resource gids to exclusion gids in parallel.
 
+        Parameters
+        ----------
+        max_in_flight : int | None
+            Maximum number of futures that can be submitted but not yet
+            collected at any one time. Results are large, so this bounds
+            the memory held by finished futures. None defaults to twice the
+            number of workers.
+
         Returns
         -------
         lats : np.ndarray
@@ -223,7 +255,12 @@ class TechMapping:
             2D integer array with shape equal to the exclusions extent shape.
         """
 
-        gids = np.array(list(range(self._n_sc)), dtype=np.uint32)
+        if max_in_flight is None:
+            max_in_flight = 2 * self._max_workers
+
+        max_in_flight = max(max_in_flight, 1)
+
+        gids = np.arange(self._n_sc, dtype=np.uint32)
         gid_chunks = np.array_split(gids, int(np.ceil(len(gids) / 2)))
 
         # init full output arrays
@@ -232,34 +269,35 @@ class TechMapping:
         n_finished = 0
         futures = {}
         loggers = [__name__, 'reV']
-        with SpawnProcessPool(max_workers=self._max_workers,
-                              loggers=loggers) as exe:
-
-            # iterate through split executions, submitting each to worker
-            for i, gid_set in enumerate(gid_chunks):
-                # submit executions and append to futures list
-                futures[exe.submit(self.map_resource_gids,
-                                   gid_set,
-                                   self._excl_fpath,
-                                   self._res_fpath,
-                                   self.distance_upper_bound,
-                                   self._map_chunk)] = i
-
-            for future in as_completed(futures):
-                n_finished += 1
-                logger.info('Parallel TechMapping futures collected: '
-                            '{} out of {}'
-                            .format(n_finished, len(futures)))
-
-                i = futures[future]
-                result = future.result()
-
-                res = self._map_chunk
-                with SupplyCurveExtent(self._excl_fpath, resolution=res) as sc:
-                    for j, gid in enumerate(gid_chunks[i]):
-                        i_out_arr = sc.get_flat_excl_ind(gid)
-                        ind_all[i_out_arr] = result[0][j]
-                        coords_all[i_out_arr, :] = result[1][j]
+        with SupplyCurveExtent(self._excl_fpath,
+                               resolution=self._map_chunk) as sc:
+            with SpawnProcessPool(max_workers=self._max_workers,
+                                  loggers=loggers) as exe:
+
+                n_submitted = 0
+                while futures or n_submitted < len(gid_chunks):
+                    # top up to max_in_flight submitted but uncollected
+                    # split executions
+                    while (n_submitted < len(gid_chunks)
+                           and len(futures) < max_in_flight):
+                        futures[exe.submit(self.map_resource_gids,
+                                           gid_chunks[n_submitted],
+                                           self._excl_fpath,
+                                           self._res_fpath,
+                                           self.distance_upper_bound,
+                                           self._map_chunk)] = n_submitted
+                        n_submitted += 1
+
+                    # store and release every finished future
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        n_finished += 1
+                        logger.info('Parallel TechMapping futures '
+                                    'collected: {} out of {}'
+                                    .format(n_finished, len(gid_chunks)))
+                        i = futures.pop(future)
+                        self._store_result(future.result(), gid_chunks[i],
+                                           sc, ind_all, coords_all)
 
         ind_all = ind_all.reshape(self._excl_shape)
         lats = coords_all[:, 0].reshape(self._excl_shape)
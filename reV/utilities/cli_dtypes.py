@@ -4,6 +4,7 @@ Custom dtypes for Click.
 """
 import click
 import logging
+import os
 
 from rex.utilities.cli_dtypes import sanitize_str, StrListType
 
@@ -80,5 +81,24 @@ class ProjectPointsType(click.ParamType):
                       .format(value, type(value)), param, ctx)
 
 
+class ExistingFileType(click.ParamType):
+    """Existing file path click input argument type.
+
+    Lighter weight than click.Path(exists=True): existence is checked with a
+    single os.stat call.
+    """
+    name = 'existing_file'
+
+    def convert(self, value, param, ctx):
+        """Check that the file path exists and return it as a string."""
+        try:
+            os.stat(value)
+        except (OSError, TypeError, ValueError):
+            self.fail('Path does not exist: {}'.format(value), param, ctx)
+
+        return value
+
+
 SAMFILES = SAMFilesType()
 PROJECTPOINTS = ProjectPointsType()
+EXISTINGFILE = ExistingFileType()
@@ -7,6 +7,7 @@ Created on Thu Nov 29 09:54:51 2018
 
 @author: gbuster
 """
+import json
 import numpy as np
 import os
 import pandas as pd
@@ -16,8 +17,11 @@ from rex import Resource
 from rex.utilities.exceptions import ResourceRuntimeError
 
 from reV.config.base_analysis_config import AnalysisConfig
+from reV.config.base_config import BaseConfig
+from reV.config.execution import BaseExecutionConfig
 from reV.config.rep_profiles_config import RepProfilesConfig
 from reV.config.project_points import ProjectPoints, PointsControl
+from reV.config.sam_config import SAMConfig
 from reV.generation.generation import Gen
 from reV.SAM.SAM import RevPySam
 from reV import TESTDATADIR
@@ -42,6 +46,27 @@ def test_overwrite():
         RepProfilesConfig(config_path)
 
 
+def test_bad_execution_option():
+    """
+    Test that a bad execution control option fails on config init
+    """
+    config = {'directories': {},
+              'execution_control': {'option': 'pbs'}}
+    with pytest.raises(ConfigError):
+        AnalysisConfig(config)
+
+
+def test_null_execution_option():
+    """
+    Test that a null execution control option defaults to a local run
+    """
+    config = {'directories': {},
+              'execution_control': {'option': None}}
+    config = AnalysisConfig(config)
+    assert config.execution_control.option == 'local'
+    assert type(config.execution_control) is BaseExecutionConfig
+
+
 def test_clearsky():
     """
     Test Clearsky
@@ -140,6 +165,56 @@ def test_config_mapping():
             assert cid == df.loc[site].values[0]
 
 
+def test_gid_config_map():
+    """Test the site gid to SAM config id lookup used by __getitem__."""
+    fpp = os.path.join(TESTDATADIR, 'project_points/pp_offshore.csv')
+    sam_files = {'onshore': os.path.join(
+                 TESTDATADIR, 'SAM/wind_gen_standard_losses_0.json'),
+                 'offshore': os.path.join(
+                 TESTDATADIR, 'SAM/wind_gen_standard_losses_1.json')}
+    pp = ProjectPoints(fpp, sam_files, 'windpower')
+
+    truth = dict(zip(pp.df['gid'], pp.df['config']))
+    assert pp.gid_config_map == truth
+
+    missing = max(pp.sites) + 1
+    with pytest.raises(KeyError):
+        pp[missing]
+
+    # duplicate gids resolve to their first occurrence, same as index()
+    points = pd.DataFrame({'gid': [0, 1, 1], 'config': ['onshore', 'onshore',
+                                                        'offshore']})
+    pp = ProjectPoints(points, sam_files, 'windpower')
+    assert pp.gid_config_map == {0: 'onshore', 1: 'onshore'}
+    assert pp.index(1) == 1
+
+
+@pytest.mark.parametrize(('points', 'truth'),
+                         [(slice(0, 100, 3), slice(0, 100, 3)),
+                          (slice(10, 20), slice(10, 20, 1)),
+                          ([7], slice(7, 8, 1)),
+                          ([1, 2, 3, 5], [1, 2, 3, 5]),
+                          ([1, 3, 4, 5, 7], [1, 3, 4, 5, 7])])
+def test_sites_as_slice(points, truth):
+    """Test the conversion of project points sites to a slice."""
+    sam_file = os.path.join(TESTDATADIR, 'SAM/wind_gen_standard_losses_0.json')
+    pp = ProjectPoints(points, sam_file, 'windpower')
+    assert pp.sites_as_slice == truth
+
+
+def test_sam_config_inputs_not_shared():
+    """Test that SAM inputs loaded from the same file are not shared between
+    SAMConfig instances."""
+    sam_file = os.path.join(TESTDATADIR, 'SAM/wind_gen_standard_losses_0.json')
+    config_0 = SAMConfig({'default': sam_file})
+    config_1 = SAMConfig({'default': sam_file})
+
+    assert config_0.inputs == config_1.inputs
+    config_0.inputs['default'].clear()
+    assert config_1.inputs['default']
+    assert SAMConfig({'default': sam_file}).inputs == config_1.inputs
+
+
 def test_sam_config_kw_replace():
     """Test that the SAM config with old keys from pysam v1 gets updated on
     the fly and gets propogated to downstream splits."""
@@ -241,6 +316,85 @@ def test_duplicate_coords():
         ProjectPoints.regions(regions, res_file, sam_files)
 
 
+def test_config_file_cache(tmp_path):
+    """Test that editing a config file invalidates the cached json."""
+    fpath = str(tmp_path / 'config.json')
+    with open(fpath, 'w') as f:
+        json.dump({'a': 1}, f)
+
+    assert BaseConfig.get_file(fpath) == {'a': 1}
+
+    # new size
+    with open(fpath, 'w') as f:
+        json.dump({'a': 1, 'b': 2}, f)
+
+    assert BaseConfig.get_file(fpath) == {'a': 1, 'b': 2}
+
+    # same size, only the mtime changes
+    stat = os.stat(fpath)
+    with open(fpath, 'w') as f:
+        json.dump({'a': 3, 'b': 4}, f)
+
+    os.utime(fpath, ns=(stat.st_atime_ns, stat.st_mtime_ns + int(1e9)))
+    assert os.stat(fpath).st_size == stat.st_size
+    assert BaseConfig.get_file(fpath) == {'a': 3, 'b': 4}
+
+
+def test_str_replace_overlapping_keys():
+    """Test that overlapping str_rep keys are replaced in a single pass with
+    the longest key taking precedence."""
+    strrep = {'./': '/config/', '../': '/parent/', '$A': '$B', '$B': 'b'}
+    config = {'fp': '../data.h5', 'fp2': './data.h5', 'chain': '$A'}
+    out = BaseConfig.str_replace(config, strrep)
+
+    assert out['fp'] == '/parent/data.h5'
+    assert out['fp2'] == '/config/data.h5'
+    assert out['chain'] == '$B'
+
+
+def test_str_replace_shared_containers():
+    """Test that str_replace does not mutate the input and that a sub-dict
+    shared by two keys is rebuilt once and stays shared."""
+    shared = {'fp': './data.h5', 'files': ['./a.h5', './b.h5']}
+    config = {'a': shared, 'b': shared, 'c': [shared, 1, None]}
+    out = BaseConfig.str_replace(config, {'./': '/config/'})
+
+    assert out['a'] is out['b']
+    assert out['c'][0] is out['a']
+    assert out['a'] is not shared
+    assert out['a']['fp'] == '/config/data.h5'
+    assert out['a']['files'] == ['/config/a.h5', '/config/b.h5']
+    assert out['c'][1:] == [1, None]
+
+    assert config['a'] is shared and config['b'] is shared
+    assert shared == {'fp': './data.h5', 'files': ['./a.h5', './b.h5']}
+
+
+def test_check_files_missing(tmp_path):
+    """Test that check_files names the missing file when several files share
+    one directory and agrees with os.path.exists on broken symlinks."""
+    present = str(tmp_path / 'present.json')
+    missing = str(tmp_path / 'missing.json')
+    broken = str(tmp_path / 'broken.json')
+    with open(present, 'w') as f:
+        json.dump({}, f)
+
+    os.symlink(missing, broken)
+
+    BaseConfig.check_files([present, present])
+    BaseConfig.check_files([present, str(tmp_path / '.')])
+    with pytest.raises(IOError) as excinfo:
+        BaseConfig.check_files([present, missing])
+
+    assert missing in str(excinfo.value)
+
+    for flist in ([broken], [present, broken]):
+        with pytest.raises(IOError) as excinfo:
+            BaseConfig.check_files(flist)
+
+        assert broken in str(excinfo.value)
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
@@ -171,6 +171,26 @@ def test_agg_profile():
         assert np.allclose(profiles[0][:, index], truth)
 
 
+def test_agg_profile_batches():
+    """Test batched parallel aggregate profiles against a serial run when
+    the batch size does not evenly divide the number of SC points."""
+
+    gen_fpath = os.path.join(TESTDATADIR, 'offshore/ri_offshore_baseline.h5')
+
+    rev_sc_fpath = os.path.join(TESTDATADIR, 'sc_out/ri_wind_farm_sc.csv')
+    rev_summary = pd.read_csv(rev_sc_fpath, index_col=0).iloc[0:7]
+
+    serial = AggregatedRepProfiles(gen_fpath, rev_summary,
+                                   cf_dset='cf_profile')
+    serial._run_serial()
+
+    parallel = AggregatedRepProfiles(gen_fpath, rev_summary,
+                                     cf_dset='cf_profile')
+    parallel._run_parallel(max_workers=2, pool_size=2, batch_size=3)
+
+    assert np.allclose(parallel.profiles[0], serial.profiles[0])
+
+
 def test_many_regions():
     """Test multiple complicated regions."""
     sites = np.arange(100)
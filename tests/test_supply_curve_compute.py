@@ -181,6 +181,36 @@ def test_parallel(sc_points, trans_table, multipliers):
     assert_frame_equal(sc_full_parallel, sc_full_serial)
 
 
+def test_parallel_sc_point_chunk(sc_points, trans_table, multipliers):
+    """Test a parallel LCOT compute with an sc_point_chunk that does not
+    evenly divide the number of supply curve points against a serial
+    compute"""
+    sc_points = SupplyCurve._parse_sc_points(sc_points,
+                                             sc_features=multipliers)
+    trans_table = SupplyCurve._merge_sc_trans_tables(sc_points, trans_table)
+    trans_table = SupplyCurve._feature_capacity(trans_table,
+                                                trans_costs=TRANS_COSTS_1)
+    trans_table = trans_table.sort_values('sc_gid')
+    sc_gids = trans_table['sc_gid'].unique()[:7]
+    trans_table = trans_table[trans_table['sc_gid'].isin(sc_gids)]
+
+    chunks = list(SupplyCurve._sc_table_chunks(trans_table,
+                                               sc_point_chunk=2))
+    assert [len(sc_tables) for sc_tables, _ in chunks] == [2, 2, 2, 1]
+    chunk_gids = [sc_table['sc_gid'].values[0]
+                  for sc_tables, _ in chunks for sc_table in sc_tables]
+    assert np.array_equal(chunk_gids, sc_gids)
+
+    lcot_serial, cost_serial = SupplyCurve._compute_lcot(
+        trans_table, 0.1, trans_costs=TRANS_COSTS_1, max_workers=1)
+    lcot_parallel, cost_parallel = SupplyCurve._compute_lcot(
+        trans_table, 0.1, trans_costs=TRANS_COSTS_1, max_workers=2,
+        sc_point_chunk=2)
+
+    assert np.allclose(cost_parallel, cost_serial)
+    assert np.allclose(lcot_parallel, lcot_serial)
+
+
 def execute_pytest(capture='all', flags='-rapP'):
     """Execute module as pytest with detailed summary report.
 
@@ -12,6 +12,7 @@ import os
 
 from reV import TESTDATADIR
 from reV.handlers.outputs import Outputs
+from reV.supply_curve.points import SupplyCurveExtent
 from reV.supply_curve.tech_mapping import TechMapping
 from reV.handlers.exclusions import ExclusionLayers
 
@@ -41,6 +42,34 @@ def test_resource_tech_mapping():
     assert len(set(ind.flatten())) == 101, msg
 
 
+@pytest.mark.parametrize('max_in_flight', [1, 3])
+def test_tech_mapping_max_in_flight(max_in_flight):
+    """Test the parallel tech mapping with a small window of in-flight
+    futures against a serial mapping of the same gid chunks"""
+
+    with TechMapping(EXCL, RES, TM_DSET, map_chunk=256,
+                     max_workers=2) as mapper:
+        lats, lons, ind = mapper._parallel_resource_map(
+            max_in_flight=max_in_flight)
+
+        ind_truth, coords_truth = mapper._init_out_arrays()
+        gids = np.arange(mapper._n_sc, dtype=np.uint32)
+        gid_chunks = np.array_split(gids, int(np.ceil(len(gids) / 2)))
+        with SupplyCurveExtent(EXCL, resolution=mapper._map_chunk) as sc:
+            for gid_set in gid_chunks:
+                result = TechMapping.map_resource_gids(
+                    gid_set, EXCL, RES, mapper.distance_upper_bound,
+                    mapper._map_chunk)
+                TechMapping._store_result(result, gid_set, sc, ind_truth,
+                                          coords_truth)
+
+        shape = mapper._excl_shape
+
+    assert np.array_equal(ind, ind_truth.reshape(shape))
+    assert np.allclose(lats, coords_truth[:, 0].reshape(shape))
+    assert np.allclose(lons, coords_truth[:, 1].reshape(shape))
+
+
 def plot_tech_mapping():
     """Run the supply curve technology mapping and plot the resulting mapped
     points."""